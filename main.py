@@ -14,28 +14,41 @@ Features:
 - Modern pixel art graphics
 - Coyote time and jump buffering for responsive controls
 """
-from src.game import Game
+import sys
+from src.utils.constants import QUIET
+
+
+BANNER = (
+    "=" * 50 + "\n"
+    "DASHY DUDE\n"
+    + "=" * 50 + "\n"
+    "\n"
+    "Controls:\n"
+    "  SPACE - Jump / Double Jump / Helicopter Glide\n"
+    "           (Hold SPACE after double jump to glide!)\n"
+    "  ESC   - Quit\n"
+    "\n"
+    "Starting game...\n"
+    "\n"
+)
 
 
 def main():
     """Main entry point."""
-    print("=" * 50)
-    print("DASHY DUDE")
-    print("=" * 50)
-    print()
-    print("Controls:")
-    print("  SPACE - Jump / Double Jump / Helicopter Glide")
-    print("           (Hold SPACE after double jump to glide!)")
-    print("  ESC   - Quit")
-    print()
-    print("Starting game...")
-    print()
+    # Set DASHY_QUIET=1 to skip the startup banner and exit message
+    if not QUIET:
+        sys.stdout.write(BANNER)
+        sys.stdout.flush()
+    
+    # Deferred so importing this module stays cheap
+    from src.game import Game
     
     game = Game()
     game.run()
     
-    print()
-    print("Thanks for playing!")
+    if not QUIET:
+        sys.stdout.write("\nThanks for playing!\n")
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -5,7 +5,23 @@ from enum import Enum
 import pygame
 import math
 from src.utils.constants import *
-from src.utils.math_utils import Vector2
+
+
+_sin = math.sin
+_sqrt = math.sqrt
+
+# Unit-circle vertices for the DOUBLE_POINTS star burst (8 rays, starting
+# at the top and alternating outer/inner points)
+STAR_RAYS = 8
+STAR_UNIT_POINTS = [
+    (math.cos(i * math.pi / STAR_RAYS - math.pi / 2),
+     math.sin(i * math.pi / STAR_RAYS - math.pi / 2))
+    for i in range(STAR_RAYS * 2)
+]
+
+# Rendered icon text keyed by (text, font_size, color); the glyphs don't
+# depend on theme colors, so this survives Collectible.clear_cache()
+_glyph_cache = {}
 
 
 class CollectibleType(Enum):
@@ -18,12 +34,185 @@ class CollectibleType(Enum):
     EXTRA_JUMP = "extra_jump"
 
 
+def _render_glyph(text, font_size, color):
+    """
+    Render icon text, reusing a previously rendered surface when possible.
+    
+    Args:
+        text: Text to render
+        font_size: Default font size in points
+        color: RGB text color
+    
+    Returns:
+        pygame.Surface with the rendered text
+    """
+    key = (text, font_size, color)
+    glyph = _glyph_cache.get(key)
+    if glyph is None:
+        font = pygame.font.Font(None, font_size)
+        glyph = font.render(text, True, color)
+        _glyph_cache[key] = glyph
+    return glyph
+
+
+def _draw_coin(surface, center, size, color, secondary_color):
+    """Golden coin with $ symbol and shine."""
+    radius = size // 2
+    # Outer ring
+    pygame.draw.circle(surface, (180, 150, 0), (center, center), radius)
+    # Inner gold
+    pygame.draw.circle(surface, color, (center, center), radius - 2)
+    # Highlight arc (shine effect)
+    pygame.draw.arc(surface, (255, 255, 200),
+                   (center - radius + 4, center - radius + 4, radius * 2 - 8, radius * 2 - 8),
+                   0.5, 1.5, 3)
+    # Dollar sign
+    text = _render_glyph("$", int(size * 0.8), (180, 130, 0))
+    text_rect = text.get_rect(center=(center, center))
+    surface.blit(text, text_rect)
+
+
+def _draw_speed_boost(surface, center, size, color, secondary_color):
+    """Lightning bolt icon."""
+    # Background glow circle
+    pygame.draw.circle(surface, (0, 100, 150, 100), (center, center), size // 2 + 4)
+    pygame.draw.circle(surface, secondary_color, (center, center), size // 2)
+    # Lightning bolt shape
+    bolt_points = [
+        (center + 2, center - size // 2 + 4),   # Top
+        (center - 4, center - 2),                     # Upper left
+        (center + 2, center - 2),                     # Upper middle
+        (center - 2, center + size // 2 - 4),   # Bottom
+        (center + 4, center + 2),                     # Lower right
+        (center - 2, center + 2),                     # Lower middle
+    ]
+    pygame.draw.polygon(surface, color, bolt_points)
+    # White highlight
+    pygame.draw.polygon(surface, (255, 255, 255), bolt_points, 1)
+
+
+def _draw_shield(surface, center, size, color, secondary_color):
+    """Shield/armor icon."""
+    # Outer glow
+    pygame.draw.circle(surface, (50, 150, 200, 80), (center, center), size // 2 + 4)
+    # Shield shape (pointed bottom)
+    shield_points = [
+        (center, center - size // 2 + 2),        # Top center
+        (center + size // 2 - 2, center - size // 3),  # Top right
+        (center + size // 2 - 4, center + size // 6),  # Mid right
+        (center, center + size // 2 - 2),        # Bottom point
+        (center - size // 2 + 4, center + size // 6),  # Mid left
+        (center - size // 2 + 2, center - size // 3),  # Top left
+    ]
+    pygame.draw.polygon(surface, color, shield_points)
+    # Inner shield detail
+    inner_points = [
+        (center, center - size // 3),
+        (center + size // 3 - 2, center - size // 5),
+        (center + size // 3 - 4, center + size // 10),
+        (center, center + size // 3 - 2),
+        (center - size // 3 + 4, center + size // 10),
+        (center - size // 3 + 2, center - size // 5),
+    ]
+    pygame.draw.polygon(surface, secondary_color, inner_points)
+    # Cross/plus on shield
+    pygame.draw.line(surface, (255, 255, 255),
+                   (center, center - size // 5),
+                   (center, center + size // 6), 2)
+    pygame.draw.line(surface, (255, 255, 255),
+                   (center - size // 6, center - size // 20),
+                   (center + size // 6, center - size // 20), 2)
+
+
+def _draw_magnet(surface, center, size, color, secondary_color):
+    """U-shaped magnet icon."""
+    # Background glow
+    pygame.draw.circle(surface, (200, 0, 200, 80), (center, center), size // 2 + 4)
+    pygame.draw.circle(surface, (40, 40, 60), (center, center), size // 2)
+    # Magnet U-shape
+    magnet_width = size // 3
+    magnet_height = size // 2
+    # Left pole (red)
+    pygame.draw.rect(surface, (255, 50, 50),
+                   (center - magnet_width - 2, center - magnet_height // 2,
+                    magnet_width // 2 + 2, magnet_height))
+    # Right pole (blue)
+    pygame.draw.rect(surface, (50, 50, 255),
+                   (center + magnet_width // 2, center - magnet_height // 2,
+                    magnet_width // 2 + 2, magnet_height))
+    # Bottom connector (gray)
+    pygame.draw.rect(surface, (150, 150, 150),
+                   (center - magnet_width - 2, center + magnet_height // 2 - 4,
+                    magnet_width * 2 + 4, 6))
+    # Magnetic field lines (small arcs)
+    pygame.draw.arc(surface, secondary_color,
+                  (center - size // 4, center - size // 2 - 2,
+                   size // 2, size // 3),
+                  3.14, 0, 2)
+
+
+def _draw_double_points(surface, center, size, color, secondary_color):
+    """Star burst with 2x text."""
+    # Background star burst (even vertices are ray tips)
+    outer_radius = size // 2
+    inner_radius = size // 3
+    star_points = []
+    for i, (ux, uy) in enumerate(STAR_UNIT_POINTS):
+        r = outer_radius if i % 2 == 0 else inner_radius
+        star_points.append((center + int(r * ux), center + int(r * uy)))
+    pygame.draw.polygon(surface, secondary_color, star_points)
+    pygame.draw.polygon(surface, color, star_points, 2)
+    # Inner circle
+    pygame.draw.circle(surface, color, (center, center), size // 4)
+    # 2x text
+    text = _render_glyph("2x", int(size * 0.6), (255, 255, 255))
+    text_rect = text.get_rect(center=(center, center))
+    surface.blit(text, text_rect)
+
+
+def _draw_extra_jump(surface, center, size, color, secondary_color):
+    """Spring/bouncy arrow icon."""
+    # Background circle
+    pygame.draw.circle(surface, (20, 150, 20, 100), (center, center), size // 2 + 4)
+    pygame.draw.circle(surface, secondary_color, (center, center), size // 2)
+    # Spring coils
+    coil_width = size // 3
+    coil_y_start = center + size // 4
+    for i in range(3):
+        y = coil_y_start - i * 5
+        pygame.draw.arc(surface, color,
+                      (center - coil_width // 2, y - 3, coil_width, 6),
+                      0, 3.14, 2)
+    # Upward arrow
+    arrow_points = [
+        (center, center - size // 3),           # Top point
+        (center - size // 4, center - size // 8),  # Left wing
+        (center - size // 8, center - size // 8),  # Left inner
+        (center - size // 8, center + size // 8),  # Left bottom
+        (center + size // 8, center + size // 8),  # Right bottom
+        (center + size // 8, center - size // 8),  # Right inner
+        (center + size // 4, center - size // 8),  # Right wing
+    ]
+    pygame.draw.polygon(surface, color, arrow_points)
+    pygame.draw.polygon(surface, (255, 255, 255), arrow_points, 1)
+
+
+# Icon renderer for each collectible type, used by Collectible._cache_sprite
+SPRITE_RENDERERS = {
+    CollectibleType.COIN: _draw_coin,
+    CollectibleType.SPEED_BOOST: _draw_speed_boost,
+    CollectibleType.SHIELD: _draw_shield,
+    CollectibleType.MAGNET: _draw_magnet,
+    CollectibleType.DOUBLE_POINTS: _draw_double_points,
+    CollectibleType.EXTRA_JUMP: _draw_extra_jump,
+}
+
+
 class Collectible:
     """
     Collectible item with:
     - Different types (coins, power-ups)
     - Floating animation
-    - Rotation animation
     - Magnetic attraction (when magnet active)
     - Collection effects
     """
@@ -80,9 +269,25 @@ class Collectible:
         }
     }
     
-    # Class-level sprite cache (shared across all instances)
+    # Class-level sprite cache (shared across all instances), storing
+    # (surface, half_size) per type so rendering needs no size queries
     _sprite_cache = {}
     
+    # Largest collision box half-size across all types (for broad-phase checks)
+    MAX_COLLISION_HALF = max(p['size'] for p in PROPERTIES.values()) * 0.4
+    
+    # Animation constants (angular frequency precomputed from Hz)
+    FLOAT_OMEGA = 2.0 * 2 * math.pi  # 2 Hz
+    FLOAT_AMPLITUDE = 10.0  # pixels
+    
+    # Recycled through CollectibleSpawner.collectible_pool; the magnet, collision
+    # and render passes all read these fields for every live item
+    __slots__ = (
+        'pos_x', 'pos_y', 'type', 'properties', 'size',
+        'float_offset', 'collected', 'alive', 'time_alive',
+        'attracted', 'attraction_speed', 'collision_half', 'collision_rect',
+    )
+    
     def __init__(self, x, y, collectible_type):
         """
         Initialize collectible.
@@ -92,23 +297,22 @@ class Collectible:
             y: Y position
             collectible_type: CollectibleType enum value
         """
-        self.position = Vector2(x, y)
+        self.pos_x = float(x)
+        self.pos_y = float(y)
         self.type = collectible_type
         self.properties = self.PROPERTIES[collectible_type]
         
         # Visual properties
         self.size = self.properties['size']
-        self.color = self.properties['color']
-        self.secondary_color = self.properties['secondary_color']
+        
+        # Collision box (slightly smaller than the sprite for better feel),
+        # reused and moved in place on every collision query
+        collision_size = self.size * 0.8
+        self.collision_half = collision_size / 2
+        self.collision_rect = pygame.Rect(0, 0, collision_size, collision_size)
         
         # Animation
         self.float_offset = 0.0
-        self.float_speed = 2.0  # Hz
-        self.float_amplitude = 10.0  # pixels
-        self.rotation = 0.0
-        self.rotation_speed = 180.0  # degrees per second
-        self.pulse_scale = 1.0
-        self.pulse_speed = 3.0  # Hz
         
         # State
         self.collected = False
@@ -116,208 +320,116 @@ class Collectible:
         self.time_alive = 0.0
         
         # Magnetic attraction
-        self.velocity = Vector2(0, 0)
         self.attracted = False
         self.attraction_speed = 800.0  # pixels/second
         
         # Pre-render sprite if not cached
         if collectible_type not in Collectible._sprite_cache:
-            self._cache_sprite()
+            Collectible._cache_sprite(collectible_type)
     
-    def _cache_sprite(self):
-        """Pre-render and cache the collectible sprite with distinctive icons."""
-        # Create surface with alpha channel
-        size = self.size * 2  # Extra space for effects
-        surface = pygame.Surface((size, size), pygame.SRCALPHA)
-        center = size // 2
+    def reset(self, x, y, collectible_type):
+        """
+        Reset collectible for object pooling.
         
-        # Render to surface based on type
-        if self.type == CollectibleType.COIN:
-            # Golden coin with $ symbol and shine
-            radius = self.size // 2
-            # Outer ring
-            pygame.draw.circle(surface, (180, 150, 0), (center, center), radius)
-            # Inner gold
-            pygame.draw.circle(surface, self.color, (center, center), radius - 2)
-            # Highlight arc (shine effect)
-            pygame.draw.arc(surface, (255, 255, 200),
-                           (center - radius + 4, center - radius + 4, radius * 2 - 8, radius * 2 - 8),
-                           0.5, 1.5, 3)
-            # Dollar sign
-            font = pygame.font.Font(None, int(self.size * 0.8))
-            text = font.render("$", True, (180, 130, 0))
-            text_rect = text.get_rect(center=(center, center))
-            surface.blit(text, text_rect)
+        Args:
+            x: X position
+            y: Y position
+            collectible_type: CollectibleType enum value
+        """
+        self.pos_x = float(x)
+        self.pos_y = float(y)
+        self.type = collectible_type
+        self.properties = self.PROPERTIES[collectible_type]
         
-        elif self.type == CollectibleType.SPEED_BOOST:
-            # Lightning bolt icon
-            # Background glow circle
-            pygame.draw.circle(surface, (0, 100, 150, 100), (center, center), self.size // 2 + 4)
-            pygame.draw.circle(surface, self.secondary_color, (center, center), self.size // 2)
-            # Lightning bolt shape
-            bolt_points = [
-                (center + 2, center - self.size // 2 + 4),   # Top
-                (center - 4, center - 2),                     # Upper left
-                (center + 2, center - 2),                     # Upper middle
-                (center - 2, center + self.size // 2 - 4),   # Bottom
-                (center + 4, center + 2),                     # Lower right
-                (center - 2, center + 2),                     # Lower middle
-            ]
-            pygame.draw.polygon(surface, self.color, bolt_points)
-            # White highlight
-            pygame.draw.polygon(surface, (255, 255, 255), bolt_points, 1)
+        # Visual properties
+        self.size = self.properties['size']
         
-        elif self.type == CollectibleType.SHIELD:
-            # Shield/armor icon
-            # Outer glow
-            pygame.draw.circle(surface, (50, 150, 200, 80), (center, center), self.size // 2 + 4)
-            # Shield shape (pointed bottom)
-            shield_points = [
-                (center, center - self.size // 2 + 2),        # Top center
-                (center + self.size // 2 - 2, center - self.size // 3),  # Top right
-                (center + self.size // 2 - 4, center + self.size // 6),  # Mid right
-                (center, center + self.size // 2 - 2),        # Bottom point
-                (center - self.size // 2 + 4, center + self.size // 6),  # Mid left
-                (center - self.size // 2 + 2, center - self.size // 3),  # Top left
-            ]
-            pygame.draw.polygon(surface, self.color, shield_points)
-            # Inner shield detail
-            inner_points = [
-                (center, center - self.size // 3),
-                (center + self.size // 3 - 2, center - self.size // 5),
-                (center + self.size // 3 - 4, center + self.size // 10),
-                (center, center + self.size // 3 - 2),
-                (center - self.size // 3 + 4, center + self.size // 10),
-                (center - self.size // 3 + 2, center - self.size // 5),
-            ]
-            pygame.draw.polygon(surface, self.secondary_color, inner_points)
-            # Cross/plus on shield
-            pygame.draw.line(surface, (255, 255, 255),
-                           (center, center - self.size // 5),
-                           (center, center + self.size // 6), 2)
-            pygame.draw.line(surface, (255, 255, 255),
-                           (center - self.size // 6, center - self.size // 20),
-                           (center + self.size // 6, center - self.size // 20), 2)
+        # Resize collision box for the new type
+        collision_size = self.size * 0.8
+        self.collision_half = collision_size / 2
+        self.collision_rect.size = (collision_size, collision_size)
         
-        elif self.type == CollectibleType.MAGNET:
-            # U-shaped magnet icon
-            # Background glow
-            pygame.draw.circle(surface, (200, 0, 200, 80), (center, center), self.size // 2 + 4)
-            pygame.draw.circle(surface, (40, 40, 60), (center, center), self.size // 2)
-            # Magnet U-shape
-            magnet_width = self.size // 3
-            magnet_height = self.size // 2
-            # Left pole (red)
-            pygame.draw.rect(surface, (255, 50, 50),
-                           (center - magnet_width - 2, center - magnet_height // 2,
-                            magnet_width // 2 + 2, magnet_height))
-            # Right pole (blue)
-            pygame.draw.rect(surface, (50, 50, 255),
-                           (center + magnet_width // 2, center - magnet_height // 2,
-                            magnet_width // 2 + 2, magnet_height))
-            # Bottom connector (gray)
-            pygame.draw.rect(surface, (150, 150, 150),
-                           (center - magnet_width - 2, center + magnet_height // 2 - 4,
-                            magnet_width * 2 + 4, 6))
-            # Magnetic field lines (small arcs)
-            pygame.draw.arc(surface, self.secondary_color,
-                          (center - self.size // 4, center - self.size // 2 - 2,
-                           self.size // 2, self.size // 3),
-                          3.14, 0, 2)
+        # Reset animation
+        self.float_offset = 0.0
         
-        elif self.type == CollectibleType.DOUBLE_POINTS:
-            # Star burst with 2x text
-            # Background star burst
-            num_rays = 8
-            outer_radius = self.size // 2
-            inner_radius = self.size // 3
-            star_points = []
-            for i in range(num_rays * 2):
-                angle = (i * math.pi / num_rays) - math.pi / 2
-                if i % 2 == 0:
-                    r = outer_radius
-                else:
-                    r = inner_radius
-                px = center + int(r * math.cos(angle))
-                py = center + int(r * math.sin(angle))
-                star_points.append((px, py))
-            pygame.draw.polygon(surface, self.secondary_color, star_points)
-            pygame.draw.polygon(surface, self.color, star_points, 2)
-            # Inner circle
-            pygame.draw.circle(surface, self.color, (center, center), self.size // 4)
-            # 2x text
-            font = pygame.font.Font(None, int(self.size * 0.6))
-            text = font.render("2x", True, (255, 255, 255))
-            text_rect = text.get_rect(center=(center, center))
-            surface.blit(text, text_rect)
+        # Reset state
+        self.collected = False
+        self.alive = True
+        self.time_alive = 0.0
         
-        elif self.type == CollectibleType.EXTRA_JUMP:
-            # Spring/bouncy arrow icon
-            # Background circle
-            pygame.draw.circle(surface, (20, 150, 20, 100), (center, center), self.size // 2 + 4)
-            pygame.draw.circle(surface, self.secondary_color, (center, center), self.size // 2)
-            # Spring coils
-            coil_width = self.size // 3
-            coil_y_start = center + self.size // 4
-            for i in range(3):
-                y = coil_y_start - i * 5
-                pygame.draw.arc(surface, self.color,
-                              (center - coil_width // 2, y - 3, coil_width, 6),
-                              0, 3.14, 2)
-            # Upward arrow
-            arrow_points = [
-                (center, center - self.size // 3),           # Top point
-                (center - self.size // 4, center - self.size // 8),  # Left wing
-                (center - self.size // 8, center - self.size // 8),  # Left inner
-                (center - self.size // 8, center + self.size // 8),  # Left bottom
-                (center + self.size // 8, center + self.size // 8),  # Right bottom
-                (center + self.size // 8, center - self.size // 8),  # Right inner
-                (center + self.size // 4, center - self.size // 8),  # Right wing
-            ]
-            pygame.draw.polygon(surface, self.color, arrow_points)
-            pygame.draw.polygon(surface, (255, 255, 255), arrow_points, 1)
+        # Reset magnetic attraction
+        self.attracted = False
         
-        # Cache the surface
-        Collectible._sprite_cache[self.type] = surface
+        if collectible_type not in Collectible._sprite_cache:
+            Collectible._cache_sprite(collectible_type)
     
-    def update(self, dt, player_pos=None, magnet_active=False):
+    @classmethod
+    def _cache_sprite(cls, collectible_type):
         """
-        Update collectible animation and behavior.
+        Pre-render and cache a collectible type's sprite with its distinctive icon.
+        
+        Args:
+            collectible_type: CollectibleType enum value
+        """
+        properties = cls.PROPERTIES[collectible_type]
+        
+        # Create surface with alpha channel
+        icon_size = properties['size']
+        size = icon_size * 2  # Extra space for effects
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        center = size // 2
+        
+        # Render to surface based on type
+        SPRITE_RENDERERS[collectible_type](surface, center, icon_size,
+                                           properties['color'], properties['secondary_color'])
+        
+        # Match the display pixel format once so blits skip per-frame conversion
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        
+        # Cache the surface along with its half size for centering
+        cls._sprite_cache[collectible_type] = (surface, size // 2)
+    
+    def update(self, dt, visible_right=None):
+        """
+        Update collectible animation.
         
         Args:
             dt: Delta time in seconds
-            player_pos: Player position Vector2 (for magnet attraction)
-            magnet_active: Whether magnet power-up is active
+            visible_right: World X past which the collectible is off-screen and
+                its float animation can be skipped (None always animates)
         """
         self.time_alive += dt
         
-        # Floating animation
-        self.float_offset = math.sin(self.time_alive * self.float_speed * 2 * math.pi) * self.float_amplitude
+        # Floating only depends on time_alive, so off-screen collectibles can
+        # skip it and pick up the correct phase once they scroll into view
+        if visible_right is None or self.pos_x <= visible_right:
+            self.float_offset = _sin(self.time_alive * self.FLOAT_OMEGA) * self.FLOAT_AMPLITUDE
+    
+    def update_magnet(self, dt, player_pos):
+        """
+        Pull collectible towards the player (only called while magnet is active).
         
-        # Rotation animation
-        self.rotation += self.rotation_speed * dt
-        if self.rotation >= 360:
-            self.rotation -= 360
+        Args:
+            dt: Delta time in seconds
+            player_pos: Player position Vector2
+        """
+        if self.collected:
+            return
         
-        # Pulse animation
-        self.pulse_scale = 1.0 + math.sin(self.time_alive * self.pulse_speed * 2 * math.pi) * 0.1
+        self.attracted = True
+        # Calculate direction to player
+        pos_x = self.pos_x
+        pos_y = self.pos_y
+        dx = player_pos.x - pos_x
+        dy = player_pos.y - pos_y
+        distance_sq = dx * dx + dy * dy
         
-        # Magnetic attraction
-        if magnet_active and player_pos and not self.collected:
-            self.attracted = True
-            # Calculate direction to player
-            dx = player_pos.x - self.position.x
-            dy = player_pos.y - self.position.y
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            if distance > 0:
-                # Normalize and apply attraction
-                self.velocity.x = (dx / distance) * self.attraction_speed
-                self.velocity.y = (dy / distance) * self.attraction_speed
-                
-                # Move towards player
-                self.position.x += self.velocity.x * dt
-                self.position.y += self.velocity.y * dt
+        if distance_sq > 0:
+            # Normalize and scale in one step, then move towards player
+            step = self.attraction_speed * dt / _sqrt(distance_sq)
+            self.pos_x = pos_x + dx * step
+            self.pos_y = pos_y + dy * step
     
     def collect(self):
         """Mark collectible as collected."""
@@ -329,38 +441,43 @@ class Collectible:
         Get collision rectangle.
         
         Returns:
-            pygame.Rect for collision detection
+            pygame.Rect for collision detection (shared; valid until the next call)
         """
-        # Use slightly smaller collision box for better feel
-        collision_size = self.size * 0.8
-        return pygame.Rect(
-            self.position.x - collision_size / 2,
-            self.position.y - collision_size / 2 + self.float_offset,
-            collision_size,
-            collision_size
-        )
+        rect = self.collision_rect
+        rect.x = self.pos_x - self.collision_half
+        rect.y = self.pos_y - self.collision_half + self.float_offset
+        return rect
     
-    def render(self, screen, camera):
+    def get_blit_args(self, camera):
         """
-        Render collectible with animations using cached sprite (optimized).
+        Get the cached sprite and its screen position for batched blitting.
         
         Args:
-            screen: pygame.Surface to draw on
             camera: Camera instance
+        
+        Returns:
+            (surface, (x, y)) tuple for Surface.fblits, or None if no sprite is cached
         """
         # Get cached sprite
-        cached_sprite = Collectible._sprite_cache.get(self.type)
-        if not cached_sprite:
-            return
+        cache_entry = Collectible._sprite_cache.get(self.type)
+        if cache_entry is None:
+            return None
+        cached_sprite, half_size = cache_entry
         
         # Get screen position
-        screen_pos = camera.world_to_screen(self.position)
-        x = int(screen_pos.x)
-        y = int(screen_pos.y + self.float_offset)
+        screen_x, screen_y = camera.world_to_screen_xy(self.pos_x, self.pos_y)
+        x = int(screen_x)
+        y = int(screen_y + self.float_offset)
         
-        # Skip pulse scaling for better performance - use cached sprite directly
-        sprite_size = cached_sprite.get_width()
-        screen.blit(cached_sprite, (x - sprite_size // 2, y - sprite_size // 2))
+        # Use cached sprite directly (no per-frame scaling)
+        return cached_sprite, (x - half_size, y - half_size)
+    
+    @classmethod
+    def prewarm(cls):
+        """Render and cache sprites for every type up front (call after display init)."""
+        for collectible_type in CollectibleType:
+            if collectible_type not in cls._sprite_cache:
+                cls._cache_sprite(collectible_type)
     
     @classmethod
     def clear_cache(cls):
@@ -2,11 +2,119 @@
 Platform entity with different types and behaviors.
 """
 from enum import Enum
+import functools
 import random
 import pygame
 import math
 from src.utils.constants import *
-from src.utils.math_utils import Vector2, lerp
+from src.utils.math_utils import lerp, squash_at_rest
+from src.graphics.sprite_cache import get_scaled_sprite
+
+
+_sin = math.sin
+
+# Conveyor directions drawn on reset (tuple avoids a list per call)
+CONVEYOR_DIRECTIONS = (-1, 1)
+
+# Conveyor arrow geometry (fallback render)
+CONVEYOR_ARROW_SPACING = 30
+CONVEYOR_ARROW_SIZE = 8  # Larger arrows
+CONVEYOR_ARROW_MARGIN = 2 * CONVEYOR_ARROW_SIZE + 1  # Arrow overhang past the platform edge
+
+
+@functools.lru_cache(maxsize=64)
+def _get_faded_sprite(sprite, alpha):
+    """
+    Get a copy of a sprite with surface alpha applied, cached per alpha level.
+    
+    Args:
+        sprite: Source pygame.Surface (cached by identity)
+        alpha: Surface alpha (0-255)
+    
+    Returns:
+        Faded pygame.Surface (shared; do not modify)
+    """
+    faded = sprite.copy()
+    faded.set_alpha(alpha)
+    return faded
+
+
+@functools.lru_cache(maxsize=128)
+def _get_translucent_rect(width, height, color):
+    """
+    Get a filled rectangle surface with per-pixel alpha, cached per size and color.
+    
+    Args:
+        width, height: Size in pixels
+        color: (r, g, b, a) fill color
+    
+    Returns:
+        pygame.Surface with SRCALPHA (shared; do not modify)
+    """
+    surf = pygame.Surface((width, height), pygame.SRCALPHA)
+    surf.fill(color)
+    return surf
+
+
+@functools.lru_cache(maxsize=128)
+def _get_conveyor_arrows(width, moving_right, offset):
+    """
+    Pre-render a conveyor platform's row of arrows for one animation offset.
+    
+    Args:
+        width: Platform width in pixels
+        moving_right: True for right-pointing arrows, False for left
+        offset: Integer arrow animation offset (0 to CONVEYOR_ARROW_SPACING - 1)
+    
+    Returns:
+        pygame.Surface to blit at (x - CONVEYOR_ARROW_MARGIN, arrow_y - CONVEYOR_ARROW_SIZE - 1)
+    """
+    arrow_color = (255, 255, 255)
+    arrow_outline = (80, 50, 10)  # Dark brown outline
+    arrow_size = CONVEYOR_ARROW_SIZE
+    
+    strip = pygame.Surface((int(width) + 2 * CONVEYOR_ARROW_MARGIN + 1, 2 * arrow_size + 3),
+                           pygame.SRCALPHA)
+    arrow_y = arrow_size + 1
+    
+    for i in range(-CONVEYOR_ARROW_SPACING, int(width) + CONVEYOR_ARROW_SPACING, CONVEYOR_ARROW_SPACING):
+        arrow_x = i + offset
+        
+        # Only draw if arrow is within platform bounds
+        if arrow_x < -arrow_size or arrow_x > width + arrow_size:
+            continue
+        arrow_x += CONVEYOR_ARROW_MARGIN
+        
+        if moving_right:
+            # Right arrow (pointing right, moving right)
+            # Draw outline first
+            pygame.draw.polygon(strip, arrow_outline, [
+                (arrow_x - arrow_size - 1, arrow_y - arrow_size - 1),
+                (arrow_x + arrow_size + 1, arrow_y),
+                (arrow_x - arrow_size - 1, arrow_y + arrow_size + 1)
+            ])
+            # Draw arrow
+            pygame.draw.polygon(strip, arrow_color, [
+                (arrow_x - arrow_size, arrow_y - arrow_size),
+                (arrow_x + arrow_size, arrow_y),
+                (arrow_x - arrow_size, arrow_y + arrow_size)
+            ])
+        else:
+            # Left arrow (pointing left, moving left)
+            # Draw outline first
+            pygame.draw.polygon(strip, arrow_outline, [
+                (arrow_x + arrow_size + 1, arrow_y - arrow_size - 1),
+                (arrow_x - arrow_size - 1, arrow_y),
+                (arrow_x + arrow_size + 1, arrow_y + arrow_size + 1)
+            ])
+            # Draw arrow
+            pygame.draw.polygon(strip, arrow_color, [
+                (arrow_x + arrow_size, arrow_y - arrow_size),
+                (arrow_x - arrow_size, arrow_y),
+                (arrow_x + arrow_size, arrow_y + arrow_size)
+            ])
+    
+    return strip
 
 
 class PlatformType(Enum):
@@ -22,18 +130,48 @@ class PlatformType(Enum):
     SPRING = "spring"
 
 
+# Fallback rectangle colors when no sprite is loaded (others use PLATFORM_BASE)
+FALLBACK_COLORS = {
+    PlatformType.MOVING: PLATFORM_MOVING,
+    PlatformType.SMALL: PLATFORM_SMALL,
+    PlatformType.CRUMBLING: PLATFORM_CRUMBLING,
+    PlatformType.BOUNCY: (255, 165, 0),  # Orange
+    PlatformType.ICE: (173, 216, 230),  # Light blue
+    PlatformType.CONVEYOR: (139, 69, 19),  # Brown
+    PlatformType.SPRING: (50, 205, 50),  # Lime green
+}
+
+
 class Platform:
     """
     Platform entity that player can land on.
     Supports different types with unique behaviors.
     """
     
+    # PlatformGenerator recycles a fixed pool of these; update, collision and
+    # render all read them for every live platform
+    __slots__ = (
+        'pos_x', 'pos_y', 'width', 'height', 'platform_type', 'sprite_key', 'active',
+        'move_speed', 'move_range', 'start_x', 'move_direction', 'move_time',
+        'crumble_timer', 'crumble_delay', 'is_crumbling', 'player_landed',
+        'bounce_multiplier', 'bouncy_compression', 'bouncy_compressed',
+        'ice_friction',
+        'conveyor_speed', 'conveyor_direction', 'conveyor_animation_offset',
+        'disappear_timer', 'disappear_interval', 'reappear_interval',
+        'is_visible', 'disappear_cycle_time',
+        'spring_force', 'spring_compressed', 'spring_compression',
+        'sprite', 'scale_y', 'target_scale_y', 'squash_speed',
+        'rect', 'rect_dirty',
+    )
+    
     def __init__(self, x=0, y=0, width=MAX_PLATFORM_WIDTH, height=PLATFORM_HEIGHT,
                  platform_type=PlatformType.STATIC):
-        self.position = Vector2(x, y)
+        self.pos_x = float(x)
+        self.pos_y = float(y)
         self.width = width * PLATFORM_SCALE
         self.height = height * PLATFORM_SCALE
         self.platform_type = platform_type
+        self.sprite_key = platform_type.value  # Cached: Enum.value is a property lookup
         self.active = True
         
         # Moving platform
@@ -81,6 +219,10 @@ class Platform:
         self.scale_y = 1.0
         self.target_scale_y = 1.0
         self.squash_speed = 25.0  # Faster squash response
+        
+        # Collision rect, reused and refreshed only after the platform moves
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.rect_dirty = True
     
     def update(self, dt):
         """
@@ -92,18 +234,14 @@ class Platform:
         if not self.active:
             return
         
-        if self.platform_type == PlatformType.MOVING:
-            self._update_moving(dt)
-        elif self.platform_type == PlatformType.CRUMBLING:
-            self._update_crumbling(dt)
-        elif self.platform_type == PlatformType.DISAPPEARING:
-            self._update_disappearing(dt)
-        elif self.platform_type == PlatformType.SPRING:
-            self._update_spring(dt)
-        elif self.platform_type == PlatformType.BOUNCY:
-            self._update_bouncy(dt)
-        elif self.platform_type == PlatformType.CONVEYOR:
-            self._update_conveyor(dt)
+        # Type-specific behavior via jump table (static types have none)
+        updater = Platform._UPDATERS.get(self.platform_type)
+        if updater is not None:
+            updater(self, dt)
+        
+        # Nothing to animate while squash and stretch is at rest
+        if self.scale_y == 1.0 and self.target_scale_y == 1.0:
+            return
         
         # Update squash and stretch - faster for bouncy platforms
         if self.platform_type in (PlatformType.BOUNCY, PlatformType.SPRING):
@@ -118,14 +256,20 @@ class Platform:
             self.scale_y = max(0.25, min(1.5, self.scale_y))
         else:
             self.scale_y = max(0.5, min(1.2, self.scale_y))
+        
+        # Settle at full height so the early return above kicks in next frame
+        if squash_at_rest(self.scale_y, self.target_scale_y):
+            self.scale_y = 1.0
+            self.target_scale_y = 1.0
     
     def _update_moving(self, dt):
         """Update moving platform position."""
         self.move_time += dt
         
         # Oscillate using sine wave
-        offset = math.sin(self.move_time * 2.0) * self.move_range
-        self.position.x = self.start_x + offset
+        offset = _sin(self.move_time * 2.0) * self.move_range
+        self.pos_x = self.start_x + offset
+        self.rect_dirty = True
     
     def _update_crumbling(self, dt):
         """Update crumbling platform state."""
@@ -171,10 +315,19 @@ class Platform:
     def _update_conveyor(self, dt):
         """Update conveyor belt animation."""
         # Animate the arrow offset in the direction of the conveyor
-        arrow_spacing = 30
         self.conveyor_animation_offset += self.conveyor_speed * self.conveyor_direction * dt * 0.5
         # Wrap the offset to prevent overflow
-        self.conveyor_animation_offset = self.conveyor_animation_offset % arrow_spacing
+        self.conveyor_animation_offset = self.conveyor_animation_offset % CONVEYOR_ARROW_SPACING
+    
+    # Per-type update handlers, looked up once per frame instead of an if/elif chain
+    _UPDATERS = {
+        PlatformType.MOVING: _update_moving,
+        PlatformType.CRUMBLING: _update_crumbling,
+        PlatformType.DISAPPEARING: _update_disappearing,
+        PlatformType.SPRING: _update_spring,
+        PlatformType.BOUNCY: _update_bouncy,
+        PlatformType.CONVEYOR: _update_conveyor,
+    }
     
     def on_player_land(self):
         """Called when player lands on this platform."""
@@ -204,11 +357,12 @@ class Platform:
             width, height: Dimensions (will be scaled)
             platform_type: PlatformType enum
         """
-        self.position.x = x
-        self.position.y = y
+        self.pos_x = float(x)
+        self.pos_y = float(y)
         self.width = width * PLATFORM_SCALE
         self.height = height * PLATFORM_SCALE
         self.platform_type = platform_type
+        self.sprite_key = platform_type.value
         self.active = True
         
         # Reset moving platform
@@ -222,7 +376,7 @@ class Platform:
         self.player_landed = False
         
         # Reset conveyor platform (randomize direction)
-        self.conveyor_direction = random.choice([-1, 1])
+        self.conveyor_direction = random.choice(CONVEYOR_DIRECTIONS)
         self.conveyor_animation_offset = 0.0
         
         # Reset disappearing platform
@@ -240,20 +394,24 @@ class Platform:
         # Reset squash and stretch
         self.scale_y = 1.0
         self.target_scale_y = 1.0
+        self.rect_dirty = True
     
     def get_rect(self):
         """
         Get collision rectangle.
         
         Returns:
-            pygame.Rect for collision detection
+            pygame.Rect for collision detection (shared; do not modify)
         """
-        return pygame.Rect(
-            int(self.position.x),
-            int(self.position.y),
-            int(self.width),
-            int(self.height)
-        )
+        if self.rect_dirty:
+            self.rect.update(
+                int(self.pos_x),
+                int(self.pos_y),
+                int(self.width),
+                int(self.height)
+            )
+            self.rect_dirty = False
+        return self.rect
     
     def get_render_position(self, camera):
         """
@@ -265,23 +423,86 @@ class Platform:
         Returns:
             Tuple of (x, y) screen coordinates
         """
-        screen_pos = camera.world_to_screen(self.position)
-        return (int(screen_pos.x), int(screen_pos.y))
+        screen_x, screen_y = camera.world_to_screen_xy(self.pos_x, self.pos_y)
+        return (int(screen_x), int(screen_y))
+    
+    def get_blit_args(self, camera, sprites):
+        """
+        Get the platform sprite and its screen position for batched blitting.
+        
+        Args:
+            camera: Camera instance
+            sprites: Dictionary of platform sprites
+        
+        Returns:
+            (surface, (x, y)) tuple for Surface.fblits, or None if nothing to draw
+        """
+        if not self.active:
+            return None
+        
+        # Check if visible
+        if not camera.is_visible(self.pos_x, self.pos_y,
+                                 self.width, self.height):
+            return None
+        
+        sprite = sprites.get(self.sprite_key)
+        if not sprite:
+            return None
+        
+        return self._get_sprite_blit(sprite, self.get_render_position(camera))
+    
+    def _get_sprite_blit(self, sprite, pos):
+        """
+        Scale sprite for squash/stretch and apply crumbling transparency.
+        
+        Args:
+            sprite: Unscaled platform sprite
+            pos: (x, y) screen position of the unsquashed platform
+        
+        Returns:
+            (surface, (x, y)) tuple ready to blit
+        """
+        if self.scale_y == 1.0:
+            # At rest: full-height sprite, no offset
+            height_diff = 0
+            scaled_sprite = get_scaled_sprite(sprite, int(self.width), int(self.height))
+        else:
+            # Calculate scaled height
+            scaled_height = int(self.height * self.scale_y)
+            height_diff = self.height - scaled_height
+            
+            # Scale sprite to match platform width and squash/stretch
+            scaled_sprite = get_scaled_sprite(sprite, int(self.width), scaled_height)
+        
+        # Apply transparency if crumbling, quantized so faded copies are reused
+        if self.platform_type == PlatformType.CRUMBLING and self.player_landed:
+            fade = 1.0 - self.crumble_timer / self.crumble_delay
+            level = math.ceil(fade * CRUMBLE_ALPHA_STEPS)
+            alpha = min(255, level * 256 // CRUMBLE_ALPHA_STEPS)
+            scaled_sprite = _get_faded_sprite(scaled_sprite, alpha)
+        
+        return scaled_sprite, (pos[0], pos[1] + height_diff)
     
     def render(self, screen, camera, sprites):
         """
-        Render platform sprite.
+        Render platform sprite, or a colored rectangle when no sprite is loaded.
         
         Args:
             screen: pygame.Surface to draw on
             camera: Camera instance
             sprites: Dictionary of platform sprites
         """
+        if self.sprite_key in sprites:
+            blit_args = self.get_blit_args(camera, sprites)
+            if blit_args:
+                screen.blit(*blit_args)
+            return
+        
         if not self.active:
             return
         
         # Check if visible
-        if not camera.is_visible(self.position.x, self.position.y,
+        if not camera.is_visible(self.pos_x, self.pos_y,
                                  self.width, self.height):
             return
         
@@ -291,109 +512,40 @@ class Platform:
         scaled_height = int(self.height * self.scale_y)
         height_diff = self.height - scaled_height
         
-        # Get appropriate sprite
-        sprite_key = self.platform_type.value
-        if sprite_key in sprites:
-            sprite = sprites[sprite_key]
-            
-            # Scale sprite to match platform width and squash/stretch
-            if sprite:
-                scaled_sprite = pygame.transform.scale(sprite,
-                    (int(self.width), scaled_height))
-                
-                # Apply transparency if crumbling
-                if self.platform_type == PlatformType.CRUMBLING and self.player_landed:
-                    alpha = int(255 * (1.0 - self.crumble_timer / self.crumble_delay))
-                    scaled_sprite.set_alpha(alpha)
-                
-                screen.blit(scaled_sprite, (pos[0], pos[1] + height_diff))
-        else:
-            # Fallback: draw colored rectangle with squash/stretch
-            color = PLATFORM_BASE
-            if self.platform_type == PlatformType.MOVING:
-                color = PLATFORM_MOVING
-            elif self.platform_type == PlatformType.SMALL:
-                color = PLATFORM_SMALL
-            elif self.platform_type == PlatformType.CRUMBLING:
-                color = PLATFORM_CRUMBLING
-            elif self.platform_type == PlatformType.BOUNCY:
-                color = (255, 165, 0)  # Orange
-            elif self.platform_type == PlatformType.ICE:
-                color = (173, 216, 230)  # Light blue
-            elif self.platform_type == PlatformType.CONVEYOR:
-                color = (139, 69, 19)  # Brown
-            elif self.platform_type == PlatformType.DISAPPEARING:
-                # Fade in/out based on visibility
-                if self.is_visible:
-                    # Calculate fade based on cycle position
-                    total_cycle = self.disappear_interval + self.reappear_interval
-                    cycle_pos = self.disappear_cycle_time % total_cycle
-                    if cycle_pos < self.disappear_interval:
-                        # Visible phase - fade out near end
-                        fade_start = self.disappear_interval - 0.5
-                        if cycle_pos > fade_start:
-                            alpha = 1.0 - ((cycle_pos - fade_start) / 0.5)
-                        else:
-                            alpha = 1.0
+        # Fallback: draw colored rectangle with squash/stretch
+        color = FALLBACK_COLORS.get(self.platform_type, PLATFORM_BASE)
+        if self.platform_type == PlatformType.DISAPPEARING:
+            # Fade in/out based on visibility
+            if self.is_visible:
+                # Calculate fade based on cycle position
+                total_cycle = self.disappear_interval + self.reappear_interval
+                cycle_pos = self.disappear_cycle_time % total_cycle
+                if cycle_pos < self.disappear_interval:
+                    # Visible phase - fade out near end
+                    fade_start = self.disappear_interval - 0.5
+                    if cycle_pos > fade_start:
+                        alpha = 1.0 - ((cycle_pos - fade_start) / 0.5)
                     else:
-                        alpha = 0.0
-                    color = (255, 255, 255, int(255 * alpha))  # White with alpha
+                        alpha = 1.0
                 else:
-                    return  # Don't render if invisible
-            elif self.platform_type == PlatformType.SPRING:
-                color = (50, 205, 50)  # Lime green
-            
-            # Draw platform
-            if self.platform_type == PlatformType.DISAPPEARING and self.is_visible:
-                # Create surface with alpha for disappearing platforms
-                surf = pygame.Surface((int(self.width), scaled_height), pygame.SRCALPHA)
-                pygame.draw.rect(surf, color, (0, 0, int(self.width), scaled_height))
-                screen.blit(surf, (pos[0], pos[1] + height_diff))
+                    alpha = 0.0
+                color = (255, 255, 255, int(255 * alpha))  # White with alpha
             else:
-                pygame.draw.rect(screen, color,
-                    (pos[0], pos[1] + height_diff, self.width, scaled_height))
-            
-            # Draw conveyor arrows - larger and animated in direction of movement
-            if self.platform_type == PlatformType.CONVEYOR:
-                arrow_color = (255, 255, 255)
-                arrow_outline = (80, 50, 10)  # Dark brown outline
-                arrow_spacing = 30
-                arrow_size = 8  # Larger arrows
-                
-                # Use the animated offset
-                arrow_offset = int(self.conveyor_animation_offset)
-                
-                for i in range(-arrow_spacing, int(self.width) + arrow_spacing, arrow_spacing):
-                    arrow_x = pos[0] + i + arrow_offset
-                    arrow_y = pos[1] + height_diff + scaled_height // 2
-                    
-                    # Only draw if arrow is within platform bounds
-                    if arrow_x >= pos[0] - arrow_size and arrow_x <= pos[0] + self.width + arrow_size:
-                        if self.conveyor_direction > 0:
-                            # Right arrow (pointing right, moving right)
-                            # Draw outline first
-                            pygame.draw.polygon(screen, arrow_outline, [
-                                (arrow_x - arrow_size - 1, arrow_y - arrow_size - 1),
-                                (arrow_x + arrow_size + 1, arrow_y),
-                                (arrow_x - arrow_size - 1, arrow_y + arrow_size + 1)
-                            ])
-                            # Draw arrow
-                            pygame.draw.polygon(screen, arrow_color, [
-                                (arrow_x - arrow_size, arrow_y - arrow_size),
-                                (arrow_x + arrow_size, arrow_y),
-                                (arrow_x - arrow_size, arrow_y + arrow_size)
-                            ])
-                        else:
-                            # Left arrow (pointing left, moving left)
-                            # Draw outline first
-                            pygame.draw.polygon(screen, arrow_outline, [
-                                (arrow_x + arrow_size + 1, arrow_y - arrow_size - 1),
-                                (arrow_x - arrow_size - 1, arrow_y),
-                                (arrow_x + arrow_size + 1, arrow_y + arrow_size + 1)
-                            ])
-                            # Draw arrow
-                            pygame.draw.polygon(screen, arrow_color, [
-                                (arrow_x + arrow_size, arrow_y - arrow_size),
-                                (arrow_x - arrow_size, arrow_y),
-                                (arrow_x + arrow_size, arrow_y + arrow_size)
-                            ])
\ No newline at end of file
+                return  # Don't render if invisible
+        
+        # Draw platform
+        if self.platform_type == PlatformType.DISAPPEARING and self.is_visible:
+            # Reuse a cached translucent rectangle for disappearing platforms
+            surf = _get_translucent_rect(int(self.width), scaled_height, color)
+            screen.blit(surf, (pos[0], pos[1] + height_diff))
+        else:
+            pygame.draw.rect(screen, color,
+                (pos[0], pos[1] + height_diff, self.width, scaled_height))
+        
+        # Draw conveyor arrows - larger and animated in direction of movement
+        if self.platform_type == PlatformType.CONVEYOR:
+            arrows = _get_conveyor_arrows(self.width, self.conveyor_direction > 0,
+                                          int(self.conveyor_animation_offset))
+            arrow_y = pos[1] + height_diff + scaled_height // 2
+            screen.blit(arrows, (pos[0] - CONVEYOR_ARROW_MARGIN,
+                                 arrow_y - CONVEYOR_ARROW_SIZE - 1))
@@ -5,7 +5,8 @@ from enum import Enum
 import math
 import pygame
 from src.utils.constants import *
-from src.utils.math_utils import Vector2
+from src.utils.math_utils import squash_at_rest
+from src.graphics.sprite_cache import get_scaled_sprite
 
 
 class PlayerState(Enum):
@@ -30,9 +31,30 @@ class Player:
     - Variable jump height
     """
     
+    # Every field below is set in __init__; slots make a misspelled assignment
+    # elsewhere raise instead of quietly adding a new attribute
+    __slots__ = (
+        'pos_x', 'pos_y', 'vel_x', 'vel_y', 'width', 'height',
+        'collision_width', 'collision_height',
+        'collision_offset_x', 'collision_offset_y', 'collision_rect',
+        'state', 'on_ground', 'current_platform',
+        'jump_count', 'max_jumps',
+        'speed_boost_active', 'speed_boost_timer', 'base_speed',
+        'helicopter_active', 'helicopter_time', 'helicopter_max_time', 'can_helicopter',
+        'coyote_time', 'jump_buffer',
+        'facing_right', 'animation_controller', 'particle_timer',
+        'scale_x', 'scale_y', 'target_scale_x', 'target_scale_y', 'squash_speed',
+        'hat_alpha', 'hat_target_alpha',
+        'magnet_active', 'magnet_alpha', 'magnet_target_alpha',
+        'speed_boost_powerup_active', 'cape_alpha', 'cape_target_alpha', 'cape_animation_time',
+        'triple_jump_used',
+    )
+    
     def __init__(self, x, y):
-        self.position = Vector2(x, y)
-        self.velocity = Vector2(PLAYER_RUN_SPEED, 0)  # Always moving forward
+        self.pos_x = float(x)
+        self.pos_y = float(y)
+        self.vel_x = float(PLAYER_RUN_SPEED)  # Always moving forward
+        self.vel_y = 0.0
         self.width = PLAYER_WIDTH * PLAYER_SCALE
         self.height = PLAYER_HEIGHT * PLAYER_SCALE
         
@@ -40,6 +62,11 @@ class Player:
         self.collision_width = PLAYER_COLLISION_WIDTH * PLAYER_SCALE
         self.collision_height = PLAYER_COLLISION_HEIGHT * PLAYER_SCALE
         
+        # Center the collision box once; get_collision_rect only moves it
+        self.collision_offset_x = (self.width - self.collision_width) / 2
+        self.collision_offset_y = (self.height - self.collision_height) / 2
+        self.collision_rect = pygame.Rect(0, 0, self.collision_width, self.collision_height)
+        
         # State
         self.state = PlayerState.IDLE
         self.on_ground = False
@@ -124,7 +151,7 @@ class Player:
             self.speed_boost_timer -= dt
             if self.speed_boost_timer <= 0:
                 self.speed_boost_active = False
-                self.velocity.x = self.base_speed
+                self.vel_x = self.base_speed
         
         # Handle input - only process new jump presses, not held
         if input_handler.jump_pressed:
@@ -141,8 +168,8 @@ class Player:
                 sound_event = self.activate_helicopter()
         
         # Variable jump height
-        if input_handler.jump_released and self.velocity.y < 0:
-            self.velocity.y *= VARIABLE_JUMP_MULTIPLIER
+        if input_handler.jump_released and self.vel_y < 0:
+            self.vel_y *= VARIABLE_JUMP_MULTIPLIER
         
         # Update helicopter
         if self.helicopter_active:
@@ -150,7 +177,7 @@ class Player:
             # No time limit - helicopter lasts until landing on platform
             
             # Override gravity with slow fall
-            self.velocity.y = HELICOPTER_FALL_SPEED
+            self.vel_y = HELICOPTER_FALL_SPEED
             
             # Particle timer
             self.particle_timer += dt
@@ -218,7 +245,7 @@ class Player:
         """Execute jump based on current jump count. Returns sound event name."""
         if self.jump_count == 0:
             # First jump
-            self.velocity.y = JUMP_VELOCITY
+            self.vel_y = JUMP_VELOCITY
             self.state = PlayerState.JUMPING
             self.on_ground = False
             self.jump_count = 1
@@ -232,7 +259,7 @@ class Player:
             
         elif self.jump_count == 1:
             # Double jump with speed boost
-            self.velocity.y = DOUBLE_JUMP_VELOCITY
+            self.vel_y = DOUBLE_JUMP_VELOCITY
             self.state = PlayerState.DOUBLE_JUMPING
             self.jump_count = 2
             self.can_helicopter = True  # Enable helicopter after double jump
@@ -240,7 +267,7 @@ class Player:
             # Activate speed boost
             self.speed_boost_active = True
             self.speed_boost_timer = DOUBLE_JUMP_BOOST_DURATION
-            self.velocity.x = self.base_speed + DOUBLE_JUMP_SPEED_BOOST
+            self.vel_x = self.base_speed + DOUBLE_JUMP_SPEED_BOOST
             
             # Squash and stretch: more dramatic for double jump
             self.target_scale_x = 1.3
@@ -250,7 +277,7 @@ class Player:
         
         elif self.jump_count == 2 and self.max_jumps > 2:
             # Triple jump (only available with extra jump power-up)
-            self.velocity.y = TRIPLE_JUMP_VELOCITY  # Significantly higher jump!
+            self.vel_y = TRIPLE_JUMP_VELOCITY  # Significantly higher jump!
             self.state = PlayerState.DOUBLE_JUMPING
             self.jump_count = 3
             # Helicopter already enabled from double jump
@@ -301,7 +328,7 @@ class Player:
         
         # Reset speed boost on landing
         self.speed_boost_active = False
-        self.velocity.x = self.base_speed
+        self.vel_x = self.base_speed
         
         # Squash and stretch: squash on landing
         self.target_scale_x = 0.8
@@ -315,7 +342,7 @@ class Player:
     def die(self):
         """Player death. Returns sound event name."""
         self.state = PlayerState.DEAD
-        self.velocity.y = -300  # Small bounce
+        self.vel_y = -300  # Small bounce
         return 'death'
     
     def _update_state(self):
@@ -327,7 +354,7 @@ class Player:
             self.state = PlayerState.HELICOPTER
         elif self.on_ground:
             self.state = PlayerState.RUNNING
-        elif self.velocity.y < 0:
+        elif self.vel_y < 0:
             if self.jump_count == 2:
                 self.state = PlayerState.DOUBLE_JUMPING
             else:
@@ -337,6 +364,11 @@ class Player:
     
     def _update_squash_stretch(self, dt):
         """Update squash and stretch animation."""
+        # Nothing to animate while squash and stretch is at rest
+        if (self.scale_x == 1.0 and self.scale_y == 1.0 and
+                self.target_scale_x == 1.0 and self.target_scale_y == 1.0):
+            return
+        
         # Lerp towards target scale
         self.scale_x += (self.target_scale_x - self.scale_x) * self.squash_speed * dt
         self.scale_y += (self.target_scale_y - self.scale_y) * self.squash_speed * dt
@@ -348,24 +380,27 @@ class Player:
         # Clamp scales
         self.scale_x = max(0.5, min(1.5, self.scale_x))
         self.scale_y = max(0.5, min(1.5, self.scale_y))
+        
+        # Settle both axes after a landing or jump so this method returns
+        # early until the next one
+        if squash_at_rest(self.scale_x, self.scale_y,
+                          self.target_scale_x, self.target_scale_y):
+            self.scale_x = 1.0
+            self.scale_y = 1.0
+            self.target_scale_x = 1.0
+            self.target_scale_y = 1.0
     
     def get_collision_rect(self):
         """
         Get collision rectangle for physics.
         
         Returns:
-            pygame.Rect for collision detection
+            pygame.Rect for collision detection (shared; valid until the next call)
         """
-        # Center the collision box
-        offset_x = (self.width - self.collision_width) / 2
-        offset_y = (self.height - self.collision_height) / 2
-        
-        return pygame.Rect(
-            self.position.x + offset_x,
-            self.position.y + offset_y,
-            self.collision_width,
-            self.collision_height
-        )
+        rect = self.collision_rect
+        rect.x = self.pos_x + self.collision_offset_x
+        rect.y = self.pos_y + self.collision_offset_y
+        return rect
     
     def get_render_position(self, camera):
         """
@@ -377,8 +412,8 @@ class Player:
         Returns:
             Tuple of (x, y) screen coordinates
         """
-        screen_pos = camera.world_to_screen(self.position)
-        return (int(screen_pos.x), int(screen_pos.y))
+        screen_x, screen_y = camera.world_to_screen_xy(self.pos_x, self.pos_y)
+        return (int(screen_x), int(screen_y))
     
     def render(self, screen, camera):
         """
@@ -389,7 +424,8 @@ class Player:
             camera: Camera instance
         """
         if self.animation_controller:
-            sprite = self.animation_controller.get_current_sprite()
+            # Facing left uses frames mirrored once by the animation controller
+            sprite = self.animation_controller.get_current_sprite(self.facing_right)
             if sprite:
                 pos = self.get_render_position(camera)
                 
@@ -403,15 +439,11 @@ class Player:
                 if self.cape_alpha > 0:
                     self._render_cape(screen, pos)
                 
-                # Flip sprite if facing left
-                if not self.facing_right:
-                    sprite = pygame.transform.flip(sprite, True, False)
-                
                 # Apply squash and stretch
                 if abs(self.scale_x - 1.0) > 0.01 or abs(self.scale_y - 1.0) > 0.01:
                     new_width = int(sprite.get_width() * self.scale_x)
                     new_height = int(sprite.get_height() * self.scale_y)
-                    sprite = pygame.transform.scale(sprite, (new_width, new_height))
+                    sprite = get_scaled_sprite(sprite, new_width, new_height)
                     
                     # Adjust position to keep bottom-center anchored
                     pos = (
@@ -2,6 +2,7 @@
 Main game class with game loop and state management.
 """
 import pygame
+import sys
 import time
 from src.utils.constants import *
 from src.systems.input import InputHandler
@@ -14,6 +15,38 @@ from src.graphics.ui import UIRenderer
 from src.states.title_state import TitleState
 
 
+# Printed with a single write when the main loop starts
+LOOP_START_MESSAGE = (
+    "Game loop starting...\n"
+    "Controls: SPACE to jump/double jump/helicopter glide\n"
+    "Hold SPACE after double jump to activate helicopter!\n"
+)
+
+# Event types no state handles; blocking them lets SDL drop them before
+# they reach the Python-side event queue
+BLOCKED_EVENTS = (
+    pygame.JOYAXISMOTION,
+    pygame.JOYBALLMOTION,
+    pygame.JOYHATMOTION,
+    pygame.JOYBUTTONDOWN,
+    pygame.JOYBUTTONUP,
+    pygame.JOYDEVICEADDED,
+    pygame.JOYDEVICEREMOVED,
+    pygame.CONTROLLERAXISMOTION,
+    pygame.CONTROLLERBUTTONDOWN,
+    pygame.CONTROLLERBUTTONUP,
+    pygame.CONTROLLERDEVICEADDED,
+    pygame.CONTROLLERDEVICEREMOVED,
+    pygame.FINGERDOWN,
+    pygame.FINGERUP,
+    pygame.FINGERMOTION,
+    pygame.MULTIGESTURE,
+    pygame.TEXTINPUT,
+    pygame.TEXTEDITING,
+    pygame.MOUSEMOTION,  # Hover reads pygame.mouse.get_pos(), which SDL still updates
+)
+
+
 class Game:
     """
     Main game class that manages the game loop and states.
@@ -27,10 +60,16 @@ class Game:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Dashy Dude")
         
+        # Filter out unused event types at the SDL level
+        pygame.event.set_blocked(BLOCKED_EVENTS)
+        
         # Clock for frame rate
         self.clock = pygame.time.Clock()
         self.running = True
         
+        # Frame pacing deadline (monotonic nanoseconds)
+        self.next_frame_ns = time.perf_counter_ns() + FRAME_PERIOD_NS
+        
         # Performance tracking
         self.fps_font = pygame.font.Font(None, 24)
         self.frame_times = []
@@ -94,15 +133,15 @@ class Game:
         Main game loop with fixed timestep.
         """
         accumulator = 0.0
-        current_time = time.time()
+        current_time = time.perf_counter()
         
-        print("Game loop starting...")
-        print("Controls: SPACE to jump/double jump/helicopter glide")
-        print("Hold SPACE after double jump to activate helicopter!")
+        if not QUIET:
+            sys.stdout.write(LOOP_START_MESSAGE)
+            sys.stdout.flush()
         
         while self.running:
-            # Calculate frame time
-            new_time = time.time()
+            # Calculate frame time (monotonic clock, read once per frame)
+            new_time = time.perf_counter()
             frame_time = new_time - current_time
             current_time = new_time
             
@@ -128,7 +167,7 @@ class Game:
             
             # Cap frame rate with optional VSync
             if self.settings.get('vsync', True):
-                self.clock.tick(FPS)
+                self._pace_frame()
             else:
                 self.clock.tick()
             
@@ -141,6 +180,30 @@ class Game:
         # Cleanup
         pygame.quit()
     
+    def _pace_frame(self):
+        """
+        Wait until the next frame deadline.
+        
+        Sleeps for most of the remaining time, then busy-waits the final
+        fraction of a millisecond since OS sleeps are too coarse to land
+        on the deadline precisely.
+        """
+        target = self.next_frame_ns
+        now = time.perf_counter_ns()
+        remaining = target - now
+        
+        if remaining > FRAME_SLEEP_THRESHOLD_NS:
+            time.sleep((remaining - FRAME_SPIN_NS) / 1_000_000_000)
+        
+        while time.perf_counter_ns() < target:
+            pass
+        
+        # Advance by whole periods so pacing doesn't drift, but resync if we
+        # fell more than a frame behind instead of rushing to catch up
+        self.next_frame_ns += FRAME_PERIOD_NS
+        if now - target > FRAME_PERIOD_NS:
+            self.next_frame_ns = now + FRAME_PERIOD_NS
+    
     def handle_events(self):
         """Handle pygame events."""
         for event in pygame.event.get():
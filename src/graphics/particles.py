@@ -23,6 +23,12 @@ from src.utils.constants import (
 class Particle:
     """Base particle class with object pooling support."""
     
+    # MAX_PARTICLES of these are preallocated up front, so keep each one lean
+    __slots__ = (
+        'x', 'y', 'vx', 'vy', 'color', 'size', 'max_lifetime', 'lifetime',
+        'gravity_scale', 'fade', 'initial_size', 'active',
+    )
+    
     def __init__(self):
         """Initialize particle with default values."""
         self.x = 0.0
@@ -151,8 +157,10 @@ class ParticleSystem:
         
     def update(self, dt: float):
         """Update all active particles."""
-        # Update all active particles and remove inactive ones
-        self.active_particles = [p for p in self.active_particles if p.update(dt)]
+        # Update all active particles and remove inactive ones; skip the
+        # list rebuild entirely on idle frames with nothing to simulate
+        if self.active_particles:
+            self.active_particles = [p for p in self.active_particles if p.update(dt)]
         
         # Update helicopter timer
         if self.helicopter_timer > 0:
@@ -0,0 +1,20 @@
+"""
+Shared cache for scaled entity sprites.
+"""
+import functools
+import pygame
+
+
+@functools.lru_cache(maxsize=384)
+def get_scaled_sprite(sprite, width, height):
+    """
+    Scale a sprite, reusing earlier results for the same source and size.
+    
+    Args:
+        sprite: Source pygame.Surface (cached by identity)
+        width, height: Target size in pixels
+    
+    Returns:
+        Scaled pygame.Surface (shared; copy before modifying)
+    """
+    return pygame.transform.scale(sprite, (width, height))
@@ -57,6 +57,9 @@ class ComboIndicator:
             combo_level: Current combo multiplier level
             combo_timer: Time remaining in combo
         """
+        # Integer millisecond timestamp, read once for every pulse below
+        ticks = pygame.time.get_ticks()
+        
         # Calculate which capsules should be filled
         platforms_in_level = combo_count % PLATFORMS_PER_COMBO_LEVEL
         if platforms_in_level == 0 and combo_count > 0:
@@ -74,7 +77,7 @@ class ComboIndicator:
             
             # Pulse effect for active capsule
             if i == platforms_in_level - 1 and combo_timer > 0:
-                self.capsule_pulse[i] = math.sin(pygame.time.get_ticks() * 0.01) * 0.5 + 0.5
+                self.capsule_pulse[i] = math.sin(ticks * 0.01) * 0.5 + 0.5
             else:
                 self.capsule_pulse[i] = 0.0
         
@@ -96,7 +99,7 @@ class ComboIndicator:
         if abs(self.epic_rotation) > 0.1:
             # Damped oscillation
             self.epic_rotation *= math.exp(-dt * 6.0)
-            self.epic_rotation += math.sin(pygame.time.get_ticks() * 0.03) * self.epic_rotation * 0.5
+            self.epic_rotation += math.sin(ticks * 0.03) * self.epic_rotation * 0.5
         
         if self.epic_glow > 0:
             self.epic_glow = max(0.0, self.epic_glow - dt * 3.0)
@@ -118,7 +121,7 @@ class ComboIndicator:
         # Circle pulse based on combo level
         if combo_level > 0:
             pulse_speed = 3.0 + combo_level * 0.5
-            self.circle_pulse = math.sin(pygame.time.get_ticks() * 0.001 * pulse_speed) * 0.15 + 1.0
+            self.circle_pulse = math.sin(ticks * 0.001 * pulse_speed) * 0.15 + 1.0
         else:
             self.circle_pulse = 1.0
         
@@ -126,14 +129,14 @@ class ComboIndicator:
         if combo_timer > 0:
             if combo_timer < 0.5:
                 # Urgent pulse
-                self.timer_pulse = math.sin(pygame.time.get_ticks() * 0.02) * 0.3 + 1.0
+                self.timer_pulse = math.sin(ticks * 0.02) * 0.3 + 1.0
                 # Shake effect
                 shake_intensity = (0.5 - combo_timer) * 10
-                self.shake_offset_x = math.sin(pygame.time.get_ticks() * 0.05) * shake_intensity
-                self.shake_offset_y = math.cos(pygame.time.get_ticks() * 0.05) * shake_intensity
+                self.shake_offset_x = math.sin(ticks * 0.05) * shake_intensity
+                self.shake_offset_y = math.cos(ticks * 0.05) * shake_intensity
             elif combo_timer < 1.0:
                 # Warning pulse
-                self.timer_pulse = math.sin(pygame.time.get_ticks() * 0.01) * 0.15 + 1.0
+                self.timer_pulse = math.sin(ticks * 0.01) * 0.15 + 1.0
                 self.shake_offset_x = 0.0
                 self.shake_offset_y = 0.0
             else:
@@ -107,10 +107,7 @@ class PlayState(BaseState):
         self.game.ui_renderer.start_fade(fade_in=True)
         
         # Reset camera position
-        self.camera.position.x = 0
-        self.camera.position.y = 0
-        self.camera.target_position.x = 0
-        self.camera.target_position.y = 0
+        self.camera.reset_position()
         self.camera.reset_zoom()
         
         # Reset platform generator state
@@ -124,8 +121,8 @@ class PlayState(BaseState):
         if platforms:
             first_platform = platforms[0]
             # Place player on left edge of first platform
-            player_x = first_platform.position.x + 20  # Small offset from edge
-            player_y = first_platform.position.y - (PLAYER_HEIGHT * PLAYER_SCALE)
+            player_x = first_platform.pos_x + 20  # Small offset from edge
+            player_y = first_platform.pos_y - (PLAYER_HEIGHT * PLAYER_SCALE)
         else:
             # Fallback position
             player_x = 50
@@ -265,8 +262,8 @@ class PlayState(BaseState):
             dt,
             self.camera.position.x,
             self.platform_generator.get_platforms(),
-            Vector2(self.player.position.x + self.player.width / 2,
-                   self.player.position.y + self.player.height / 2),
+            Vector2(self.player.pos_x + self.player.width / 2,
+                   self.player.pos_y + self.player.height / 2),
             self.magnet_active
         )
         
@@ -291,8 +288,8 @@ class PlayState(BaseState):
                 self.run_stats.record_jump('helicopter')
             
             # Emit particles based on action
-            player_center_x = self.player.position.x + self.player.width / 2
-            player_bottom_y = self.player.position.y + self.player.height
+            player_center_x = self.player.pos_x + self.player.width / 2
+            player_bottom_y = self.player.pos_y + self.player.height
             
             if sound_event == 'jump':
                 # Emit dust particles on jump
@@ -300,11 +297,8 @@ class PlayState(BaseState):
             elif sound_event == 'double_jump':
                 # Emit speed boost particles on double jump
                 self.particles.emit_double_jump_boost(player_center_x, player_bottom_y)
-            elif sound_event == 'helicopter':
-                # Start looping helicopter sound
-                self.audio.play_sound(sound_event, loop=True)
             
-            # Play sound
+            # Play sound (helicopter loops until deactivated)
             if sound_event == 'helicopter':
                 self.audio.play_sound(sound_event, loop=True)
             else:
@@ -312,8 +306,8 @@ class PlayState(BaseState):
         
         # Emit helicopter trail particles continuously while active
         if self.player.helicopter_active:
-            player_center_x = self.player.position.x + self.player.width / 2
-            player_center_y = self.player.position.y + self.player.height / 2
+            player_center_x = self.player.pos_x + self.player.width / 2
+            player_center_y = self.player.pos_y + self.player.height / 2
             self.particles.emit_helicopter_trail(player_center_x, player_center_y, dt)
         
         # Stop helicopter sound if it was deactivated
@@ -353,7 +347,7 @@ class PlayState(BaseState):
             # Apply bounce/spring effects AFTER physics resolution
             if is_bouncy:
                 # Bouncy platform - launch player higher
-                self.player.velocity.y = JUMP_VELOCITY * collision_platform.bounce_multiplier
+                self.player.vel_y = JUMP_VELOCITY * collision_platform.bounce_multiplier
                 self.player.on_ground = False  # Make sure player leaves the platform
                 # Set jump state: bouncy pad counts as first jump
                 self.player.jump_count = 1
@@ -361,13 +355,13 @@ class PlayState(BaseState):
                 self.audio.play_sound('jump')
                 # Extra particles for bounce
                 self.particles.emit_jump_dust(
-                    self.player.position.x + self.player.width / 2,
-                    self.player.position.y + self.player.height
+                    self.player.pos_x + self.player.width / 2,
+                    self.player.pos_y + self.player.height
                 )
             
             elif is_spring:
                 # Spring platform - auto-jump with extra force
-                self.player.velocity.y = JUMP_VELOCITY * collision_platform.spring_force
+                self.player.vel_y = JUMP_VELOCITY * collision_platform.spring_force
                 self.player.on_ground = False  # Make sure player leaves the platform
                 # Set jump state: spring pad counts as first jump
                 self.player.jump_count = 1
@@ -375,16 +369,16 @@ class PlayState(BaseState):
                 self.audio.play_sound('double_jump')  # Higher pitch sound
                 # Extra particles for spring
                 self.particles.emit_double_jump_boost(
-                    self.player.position.x + self.player.width / 2,
-                    self.player.position.y + self.player.height
+                    self.player.pos_x + self.player.width / 2,
+                    self.player.pos_y + self.player.height
                 )
             
             # Emit landing particles
-            fall_speed = abs(self.player.velocity.y)
+            fall_speed = abs(self.player.vel_y)
             intensity = min(fall_speed / 500.0, 2.0)  # Scale with fall speed
             self.particles.emit_landing_impact(
-                self.player.position.x + self.player.width / 2,
-                self.player.position.y + self.player.height,
+                self.player.pos_x + self.player.width / 2,
+                self.player.pos_y + self.player.height,
                 intensity
             )
             
@@ -435,8 +429,8 @@ class PlayState(BaseState):
             
             # Add score popup
             self.game.ui_renderer.add_score_popup(
-                self.player.position.x + self.player.width / 2,
-                self.player.position.y,
+                self.player.pos_x + self.player.width / 2,
+                self.player.pos_y,
                 score_gain,
                 combo_multiplier
             )
@@ -459,20 +453,16 @@ class PlayState(BaseState):
             if (player_rect.right > platform_rect.left and
                 player_rect.left < platform_rect.right):
                 # Keep player on platform
-                self.player.position.y = platform_rect.top - self.player.height
-                self.player.velocity.y = 0
+                self.player.pos_y = platform_rect.top - self.player.height
+                self.player.vel_y = 0
                 
                 # Apply special platform effects while standing on them
-                if self.player.current_platform.platform_type == PlatformType.ICE:
-                    # Ice platform - reduce friction (player slides more)
-                    # This is handled by reducing the deceleration when not moving
-                    # The player will maintain more momentum
-                    pass  # Ice effect is passive, handled in player movement
-                
-                elif self.player.current_platform.platform_type == PlatformType.CONVEYOR:
+                # (ice is passive - the player keeps momentum - so only
+                # conveyors need per-frame work here)
+                if self.player.current_platform.platform_type == PlatformType.CONVEYOR:
                     # Conveyor platform - move player in direction
                     conveyor_push = self.player.current_platform.conveyor_speed * self.player.current_platform.conveyor_direction * dt
-                    self.player.position.x += conveyor_push
+                    self.player.pos_x += conveyor_push
             else:
                 # Player walked off platform edge
                 self.player.on_ground = False
@@ -496,8 +486,8 @@ class PlayState(BaseState):
                 # Shield saves the player - teleport back up to the very top
                 self.shield_active = False
                 self.run_stats.shields_used += 1
-                self.player.position.y = 50  # Respawn at the very top of the screen
-                self.player.velocity.y = JUMP_VELOCITY  # Give them a jump
+                self.player.pos_y = 50  # Respawn at the very top of the screen
+                self.player.vel_y = JUMP_VELOCITY  # Give them a jump
                 
                 # Set jump state: shield rescue counts as first jump
                 self.player.on_ground = False
@@ -507,8 +497,8 @@ class PlayState(BaseState):
                 
                 # Visual feedback
                 self.game.ui_renderer.add_score_popup(
-                    self.player.position.x + self.player.width / 2,
-                    self.player.position.y,
+                    self.player.pos_x + self.player.width / 2,
+                    self.player.pos_y,
                     "Shield Used!",
                     1.0,
                     is_text=True
@@ -519,13 +509,13 @@ class PlayState(BaseState):
                 
                 # Emit particles
                 self.particles.emit_double_jump_boost(
-                    self.player.position.x + self.player.width / 2,
-                    self.player.position.y + self.player.height
+                    self.player.pos_x + self.player.width / 2,
+                    self.player.pos_y + self.player.height
                 )
             else:
                 # Emit water splash particles
                 self.particles.emit_water_splash(
-                    self.player.position.x + self.player.width / 2,
+                    self.player.pos_x + self.player.width / 2,
                     WATER_LEVEL
                 )
                 
@@ -610,8 +600,8 @@ class PlayState(BaseState):
             
             # Add score popup
             self.game.ui_renderer.add_score_popup(
-                collectible.position.x,
-                collectible.position.y,
+                collectible.pos_x,
+                collectible.pos_y,
                 points,
                 1.0
             )
@@ -620,7 +610,7 @@ class PlayState(BaseState):
             self.audio.play_sound('landing')
             
             # Emit particles
-            self.particles.emit_jump_dust(collectible.position.x, collectible.position.y)
+            self.particles.emit_jump_dust(collectible.pos_x, collectible.pos_y)
         
         # Handle power-ups
         else:
@@ -632,7 +622,7 @@ class PlayState(BaseState):
                 self.player.base_speed = PLAYER_RUN_SPEED + 100  # Boost speed (500 total)
                 self.player.set_speed_boost_powerup_active(True)
                 if not self.player.speed_boost_active:  # If not already boosting from double jump
-                    self.player.velocity.x = self.player.base_speed
+                    self.player.vel_x = self.player.base_speed
                 # Start speed boost sound loop
                 self.audio.play_sound('speed_boost', loop=True)
             
@@ -658,8 +648,8 @@ class PlayState(BaseState):
             
             # Show power-up message
             self.game.ui_renderer.add_score_popup(
-                collectible.position.x,
-                collectible.position.y - 30,
+                collectible.pos_x,
+                collectible.pos_y - 30,
                 collectible.properties['description'],
                 1.0,
                 is_text=True
@@ -669,7 +659,7 @@ class PlayState(BaseState):
             self.audio.play_sound('double_jump')
             
             # Emit particles
-            self.particles.emit_double_jump_boost(collectible.position.x, collectible.position.y)
+            self.particles.emit_double_jump_boost(collectible.pos_x, collectible.pos_y)
     
     def _handle_game_over(self):
         """Handle game over - check for high score and save."""
@@ -950,9 +940,10 @@ class PlayState(BaseState):
     def _render_shield_effect(self, screen):
         """Render shield visual effect around player with glow and prominent outline."""
         # Get player screen position
-        screen_pos = self.camera.world_to_screen(self.player.position)
-        center_x = int(screen_pos.x + self.player.width / 2)
-        center_y = int(screen_pos.y + self.player.height / 2)
+        screen_x, screen_y = self.camera.world_to_screen_xy(
+            self.player.pos_x, self.player.pos_y)
+        center_x = int(screen_x + self.player.width / 2)
+        center_y = int(screen_y + self.player.height / 2)
         
         # Draw pulsing shield circle with enhanced glow
         pulse = abs(math.sin(pygame.time.get_ticks() * 0.005)) * 0.3 + 0.7
@@ -1158,18 +1149,31 @@ class PlayState(BaseState):
         platforms = self.platform_generator.get_platforms()
         platform_sprites = self.game.sprites.get('platforms', {})
         rendered_platforms = 0
+        blit_sequence = []  # Sprite platforms are drawn in batches via fblits()
         for platform in platforms:
             # Cull platforms outside visible area
-            platform_right = platform.position.x + platform.width
-            platform_bottom = platform.position.y + platform.height
+            platform_right = platform.pos_x + platform.width
+            platform_bottom = platform.pos_y + platform.height
             
             if (platform_right >= visible_left and
-                platform.position.x <= visible_right and
+                platform.pos_x <= visible_right and
                 platform_bottom >= visible_top and
-                platform.position.y <= visible_bottom):
-                platform.render(screen, self.camera, platform_sprites)
+                platform.pos_y <= visible_bottom):
+                if platform.sprite_key in platform_sprites:
+                    blit_args = platform.get_blit_args(self.camera, platform_sprites)
+                    if blit_args:
+                        blit_sequence.append(blit_args)
+                else:
+                    # Flush the batch first so draw order is preserved
+                    if blit_sequence:
+                        screen.fblits(blit_sequence)
+                        blit_sequence = []
+                    platform.render(screen, self.camera, platform_sprites)
                 rendered_platforms += 1
         
+        if blit_sequence:
+            screen.fblits(blit_sequence)
+        
         # Render collectibles (culling is handled in spawner)
         self.collectible_spawner.render(screen, self.camera)
         
@@ -1189,8 +1193,8 @@ class PlayState(BaseState):
             intensity = 1.0 - boost_progress  # Fade out as boost ends
             self.game.ui_renderer.render_speed_lines(
                 screen,
-                self.player.position.x + self.player.width / 2,
-                self.player.position.y + self.player.height / 2,
+                self.player.pos_x + self.player.width / 2,
+                self.player.pos_y + self.player.height / 2,
                 self.camera.position.x,
                 self.camera.position.y,
                 intensity
@@ -3,10 +3,18 @@ Title screen state with menu and animations.
 """
 import pygame
 import math
+import sys
 from src.states.base_state import BaseState
 from src.utils.constants import *
 
 
+# Printed with a single write each time the title screen is entered
+TITLE_ENTER_MESSAGE = (
+    "Title screen loaded\n"
+    "Click 'Play' to start!\n"
+)
+
+
 class TitleState(BaseState):
     """
     Title screen with animated logo, play button, and high score display.
@@ -55,8 +63,9 @@ class TitleState(BaseState):
         self.animation_time = 0.0
         # Start menu music
         self.game.audio_manager.play_menu_music()
-        print("Title screen loaded")
-        print("Click 'Play' to start!")
+        if not QUIET:
+            sys.stdout.write(TITLE_ENTER_MESSAGE)
+            sys.stdout.flush()
     
     def exit(self):
         """Called when exiting this state."""
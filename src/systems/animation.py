@@ -2,6 +2,7 @@
 Animation system for sprite frame management.
 """
 from enum import Enum
+import pygame
 from src.utils.constants import *
 from src.entities.player import PlayerState
 
@@ -16,6 +17,17 @@ class AnimationState(Enum):
     FALLING = "falling"
 
 
+# Player state to animation mapping (built once, not per frame)
+STATE_ANIMATIONS = {
+    PlayerState.IDLE: AnimationState.IDLE,
+    PlayerState.RUNNING: AnimationState.RUNNING,
+    PlayerState.JUMPING: AnimationState.JUMPING,
+    PlayerState.DOUBLE_JUMPING: AnimationState.DOUBLE_JUMPING,
+    PlayerState.HELICOPTER: AnimationState.HELICOPTER,
+    PlayerState.FALLING: AnimationState.FALLING,
+}
+
+
 class AnimationController:
     """
     Controls sprite animations with frame timing.
@@ -29,6 +41,7 @@ class AnimationController:
             sprite_sheets: Dictionary mapping animation names to frame lists
         """
         self.sprite_sheets = sprite_sheets
+        self.flipped_sprite_sheets = None  # Mirrored frames, built on first use
         self.current_animation = AnimationState.IDLE
         self.current_frame = 0
         self.animation_time = 0.0
@@ -66,32 +79,47 @@ class AnimationController:
             self.animation_time = 0.0
             self.current_frame += 1
             
-            # Loop animation
-            animation_key = self.current_animation.value
-            if animation_key in self.sprite_sheets:
-                frames = self.sprite_sheets[animation_key]
-                if self.current_frame >= len(frames):
-                    self.current_frame = 0
+            # Loop animation (single lookup instead of membership test + index)
+            frames = self.sprite_sheets.get(self.current_animation.value)
+            if frames is not None and self.current_frame >= len(frames):
+                self.current_frame = 0
     
-    def get_current_sprite(self):
+    def get_current_sprite(self, facing_right=True):
         """
         Get the current animation frame sprite.
         
+        Args:
+            facing_right: False to get the horizontally mirrored frame
+        
         Returns:
             pygame.Surface of current frame
         """
-        animation_key = self.current_animation.value
-        if animation_key in self.sprite_sheets:
-            frames = self.sprite_sheets[animation_key]
-            if frames and self.current_frame < len(frames):
-                return frames[self.current_frame]
+        sprite_sheets = self.sprite_sheets if facing_right else self._get_flipped_sprite_sheets()
+        frames = sprite_sheets.get(self.current_animation.value)
+        if frames and self.current_frame < len(frames):
+            return frames[self.current_frame]
         
         # Return first frame of idle as fallback
-        if "idle" in self.sprite_sheets and self.sprite_sheets["idle"]:
-            return self.sprite_sheets["idle"][0]
+        idle_frames = sprite_sheets.get("idle")
+        if idle_frames:
+            return idle_frames[0]
         
         return None
     
+    def _get_flipped_sprite_sheets(self):
+        """
+        Get the sprite sheets mirrored horizontally, flipping every frame once.
+        
+        Returns:
+            Dictionary mapping animation names to flipped frame lists
+        """
+        if self.flipped_sprite_sheets is None:
+            self.flipped_sprite_sheets = {
+                name: [pygame.transform.flip(frame, True, False) for frame in frames]
+                for name, frames in self.sprite_sheets.items()
+            }
+        return self.flipped_sprite_sheets
+    
     def change_animation(self, animation_state):
         """
         Change to a new animation.
@@ -113,13 +141,4 @@ class AnimationController:
         Returns:
             AnimationState enum value
         """
-        mapping = {
-            PlayerState.IDLE: AnimationState.IDLE,
-            PlayerState.RUNNING: AnimationState.RUNNING,
-            PlayerState.JUMPING: AnimationState.JUMPING,
-            PlayerState.DOUBLE_JUMPING: AnimationState.DOUBLE_JUMPING,
-            PlayerState.HELICOPTER: AnimationState.HELICOPTER,
-            PlayerState.FALLING: AnimationState.FALLING,
-        }
-        
-        return mapping.get(player_state, AnimationState.IDLE)
\ No newline at end of file
+        return STATE_ANIMATIONS.get(player_state, AnimationState.IDLE)
\ No newline at end of file
@@ -8,6 +8,15 @@ from src.utils.math_utils import Vector2, lerp
 from src.entities.player import PlayerState
 
 
+# Per-state follow smoothing; states not listed use the camera default
+STATE_SMOOTHING = {
+    PlayerState.DEAD: 0.05,  # Very smooth when dead
+    PlayerState.HELICOPTER: 0.08,  # Smooth during helicopter
+    PlayerState.JUMPING: 0.12,  # Slightly more responsive during jumps
+    PlayerState.DOUBLE_JUMPING: 0.12,
+}
+
+
 class Camera:
     """
     Camera that smoothly follows the player with screen shake support.
@@ -45,8 +54,8 @@ class Camera:
             player: Player object to follow
         """
         # Track fall distance for shake intensity
-        if player.velocity.y > 0:  # Falling
-            self.fall_distance += player.velocity.y * dt
+        if player.vel_y > 0:  # Falling
+            self.fall_distance += player.vel_y * dt
         else:
             self.fall_distance = 0
         
@@ -58,18 +67,18 @@ class Camera:
         
         # Calculate desired camera position
         # Keep player at CAMERA_PLAYER_OFFSET_X ratio of screen width
-        self.target_position.x = player.position.x - self.width * CAMERA_PLAYER_OFFSET_X
+        self.target_position.x = player.pos_x - self.width * CAMERA_PLAYER_OFFSET_X
         
         # Add anticipation offset
         self.target_position.x += self.anticipation_offset.x
         
         # Vertical: only move camera if player is outside deadzone
-        player_screen_y = player.position.y - self.position.y
+        player_screen_y = player.pos_y - self.position.y
         
         if player_screen_y < CAMERA_VERTICAL_DEADZONE:
-            self.target_position.y = player.position.y - CAMERA_VERTICAL_DEADZONE
+            self.target_position.y = player.pos_y - CAMERA_VERTICAL_DEADZONE
         elif player_screen_y > self.height - CAMERA_VERTICAL_DEADZONE:
-            self.target_position.y = player.position.y - (self.height - CAMERA_VERTICAL_DEADZONE)
+            self.target_position.y = player.pos_y - (self.height - CAMERA_VERTICAL_DEADZONE)
         else:
             self.target_position.y = self.position.y
         
@@ -100,7 +109,7 @@ class Camera:
             self.shake_offset.y = 0
         
         # Store player Y for next frame
-        self.last_player_y = player.position.y
+        self.last_player_y = player.pos_y
     
     def _update_dynamic_zoom(self, player):
         """
@@ -109,12 +118,15 @@ class Camera:
         Args:
             player: Player object
         """
-        # Calculate total speed (horizontal + vertical)
-        speed = math.sqrt(player.velocity.x ** 2 + player.velocity.y ** 2)
+        # Calculate total speed squared (horizontal + vertical)
+        vx = player.vel_x
+        vy = player.vel_y
+        speed_sq = vx * vx + vy * vy
         
         # Zoom out slightly when moving fast
-        if speed > CAMERA_ZOOM_SPEED_THRESHOLD:
+        if speed_sq > CAMERA_ZOOM_SPEED_THRESHOLD_SQ:
             # Interpolate between normal and zoomed out based on speed
+            speed = math.sqrt(speed_sq)
             speed_factor = min((speed - CAMERA_ZOOM_SPEED_THRESHOLD) / 400.0, 1.0)
             self.target_zoom = lerp(1.0, CAMERA_ZOOM_MIN, speed_factor)
         else:
@@ -131,16 +143,16 @@ class Camera:
         """
         # Horizontal anticipation based on velocity
         target_x_offset = 0
-        if abs(player.velocity.x) > 100:  # Only anticipate if moving significantly
+        if abs(player.vel_x) > 100:  # Only anticipate if moving significantly
             # Look ahead in direction of movement
-            target_x_offset = (player.velocity.x / 600.0) * CAMERA_ANTICIPATION_DISTANCE
+            target_x_offset = (player.vel_x / 600.0) * CAMERA_ANTICIPATION_DISTANCE
         
         # Vertical anticipation based on jump/fall state
         target_y_offset = 0
-        if player.velocity.y < -200:  # Jumping up
+        if player.vel_y < -200:  # Jumping up
             # Look up slightly
             target_y_offset = -CAMERA_ANTICIPATION_DISTANCE * 0.3
-        elif player.velocity.y > 300:  # Falling fast
+        elif player.vel_y > 300:  # Falling fast
             # Look down slightly
             target_y_offset = CAMERA_ANTICIPATION_DISTANCE * 0.2
         
@@ -166,15 +178,8 @@ class Camera:
         Returns:
             Smoothing factor (0-1)
         """
-        # Use different smoothing for different states
-        if player.state == PlayerState.DEAD:
-            return 0.05  # Very smooth when dead
-        elif player.state == PlayerState.HELICOPTER:
-            return 0.08  # Smooth during helicopter
-        elif player.state in [PlayerState.JUMPING, PlayerState.DOUBLE_JUMPING]:
-            return 0.12  # Slightly more responsive during jumps
-        else:
-            return self.smoothing  # Default smoothing
+        # Use different smoothing for different states (single dict lookup)
+        return STATE_SMOOTHING.get(player.state, self.smoothing)
     
     def apply_shake(self, amount, duration, zoom_out=False, fall_distance=None):
         """
@@ -228,10 +233,27 @@ class Camera:
         Returns:
             Vector2 in screen space
         """
-        return Vector2(
-            world_pos.x - self.position.x + self.shake_offset.x,
-            world_pos.y - self.position.y + self.shake_offset.y
-        )
+        return Vector2(*self.world_to_screen_xy(world_pos.x, world_pos.y))
+    
+    def reset_position(self):
+        """Move the camera (and its follow target) back to the world origin."""
+        self.position.x = 0
+        self.position.y = 0
+        self.target_position.x = 0
+        self.target_position.y = 0
+    
+    def world_to_screen_xy(self, world_x, world_y):
+        """
+        Convert world coordinates to screen coordinates without allocating a Vector2.
+        
+        Args:
+            world_x, world_y: Position in world space
+        
+        Returns:
+            Tuple of (x, y) floats in screen space
+        """
+        return (world_x - self.position.x + self.shake_offset.x,
+                world_y - self.position.y + self.shake_offset.y)
     
     def screen_to_world(self, screen_pos):
         """
@@ -262,10 +284,14 @@ class Camera:
         # Add some margin for objects just off-screen
         margin = 100
         
-        return (x + width > self.position.x - margin and
-                x < self.position.x + self.width + margin and
-                y + height > self.position.y - margin and
-                y < self.position.y + self.height + margin)
+        # Read camera position once rather than twice per axis
+        cam_x = self.position.x
+        cam_y = self.position.y
+        
+        return (x + width > cam_x - margin and
+                x < cam_x + self.width + margin and
+                y + height > cam_y - margin and
+                y < cam_y + self.height + margin)
     
     def get_view_rect(self):
         """
@@ -4,6 +4,13 @@ Input handling system with buffering and edge detection.
 import pygame
 
 
+_K_SPACE = pygame.K_SPACE
+_K_ESCAPE = pygame.K_ESCAPE
+_get_pressed_keys = pygame.key.get_pressed
+_get_mouse_pos = pygame.mouse.get_pos
+_get_mouse_buttons = pygame.mouse.get_pressed
+
+
 class InputHandler:
     """
     Handles keyboard and mouse input with advanced features:
@@ -37,9 +44,9 @@ class InputHandler:
         Update input state. Call once per frame before game logic.
         """
         # Get current keyboard state
-        keys = pygame.key.get_pressed()
-        current_jump = keys[pygame.K_SPACE]
-        current_pause = keys[pygame.K_ESCAPE]
+        keys = _get_pressed_keys()
+        current_jump = keys[_K_SPACE]
+        current_pause = keys[_K_ESCAPE]
         
         # Detect jump edges
         self.jump_pressed = current_jump and not self._prev_jump
@@ -54,8 +61,8 @@ class InputHandler:
         self._prev_pause = current_pause
         
         # Get mouse state
-        self.mouse_pos = pygame.mouse.get_pos()
-        mouse_buttons = pygame.mouse.get_pressed()
+        self.mouse_pos = _get_mouse_pos()
+        mouse_buttons = _get_mouse_buttons()
         current_mouse = mouse_buttons[0]  # Left click
         
         self.mouse_clicked = current_mouse and not self._prev_mouse
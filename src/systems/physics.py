@@ -23,25 +23,25 @@ class PhysicsEngine:
         Apply gravity acceleration to entity's velocity.
         
         Args:
-            entity: Object with velocity.y attribute
+            entity: Object with vel_y attribute
             dt: Delta time in seconds
         """
-        entity.velocity.y += self.gravity * dt
+        entity.vel_y += self.gravity * dt
         
         # Clamp to max fall speed
-        if entity.velocity.y > MAX_FALL_SPEED:
-            entity.velocity.y = MAX_FALL_SPEED
+        if entity.vel_y > MAX_FALL_SPEED:
+            entity.vel_y = MAX_FALL_SPEED
     
     def integrate_velocity(self, entity, dt):
         """
         Update entity position based on velocity.
         
         Args:
-            entity: Object with position and velocity attributes
+            entity: Object with pos_x/pos_y and vel_x/vel_y attributes
             dt: Delta time in seconds
         """
-        entity.position.x += entity.velocity.x * dt
-        entity.position.y += entity.velocity.y * dt
+        entity.pos_x += entity.vel_x * dt
+        entity.pos_y += entity.vel_y * dt
     
     def check_platform_collision(self, player, platforms):
         """
@@ -59,7 +59,7 @@ class PhysicsEngine:
         player_rect = player.get_collision_rect()
         
         # Only check collision if player is falling
-        if player.velocity.y <= 0:
+        if player.vel_y <= 0:
             return None
         
         # Add horizontal tolerance for helicopter mode to make landing more forgiving
@@ -79,7 +79,7 @@ class PhysicsEngine:
             
             # Calculate where player was last frame (approximately)
             # This helps catch fast-moving collisions
-            prev_bottom = player_rect.bottom - player.velocity.y * FIXED_DT
+            prev_bottom = player_rect.bottom - player.vel_y * FIXED_DT
             
             # Check if player crossed through the platform this frame
             # Player was above platform top last frame, and is now at or below it
@@ -100,8 +100,8 @@ class PhysicsEngine:
         platform_rect = platform.get_rect()
         
         # Place player exactly on platform
-        player.position.y = platform_rect.top - player.height
-        player.velocity.y = 0
+        player.pos_y = platform_rect.top - player.height
+        player.vel_y = 0
         
         # Update player state
         player.on_ground = True
@@ -118,7 +118,7 @@ class PhysicsEngine:
         Returns:
             True if player is in water
         """
-        return player.position.y + player.height >= water_level
+        return player.pos_y + player.height >= water_level
     
     def check_point_in_rect(self, px, py, rect):
         """
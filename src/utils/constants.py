@@ -2,12 +2,19 @@
 Game constants and configuration values.
 All measurements in pixels unless otherwise specified.
 """
+import os
+
+# Console output
+QUIET = os.environ.get('DASHY_QUIET') == '1'  # Set DASHY_QUIET=1 to skip banner and status messages
 
 # Screen settings
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
 FIXED_DT = 1.0 / FPS  # Fixed timestep for physics
+FRAME_PERIOD_NS = 1_000_000_000 // FPS  # Frame pacing period
+FRAME_SLEEP_THRESHOLD_NS = 1_500_000  # Only OS-sleep when this much time remains
+FRAME_SPIN_NS = 500_000  # Busy-wait the final stretch for precise pacing
 
 # Physics constants
 GRAVITY = 2000.0  # pixels/second²
@@ -43,6 +50,8 @@ MIN_PLATFORM_WIDTH = 65  # Balanced between original 80 and 50
 MAX_PLATFORM_WIDTH = 150  # Balanced between original 200 and 120
 SMALL_PLATFORM_WIDTH = 50  # Balanced between original 60 and 40
 PLATFORM_SPAWN_DISTANCE = 1500  # Distance ahead to spawn platforms
+SQUASH_REST_EPSILON = 1e-3  # Squash/stretch snaps to rest within this of 1.0
+CRUMBLE_ALPHA_STEPS = 16  # Alpha levels for crumbling fade (faded sprites are cached)
 
 # Platform generation
 MIN_GAP = 120  # Increased from 100 for more challenge
@@ -66,6 +75,7 @@ CAMERA_VERTICAL_DEADZONE = 200  # Vertical pixels before camera moves
 CAMERA_ZOOM_MIN = 0.95  # Minimum zoom (zoomed out)
 CAMERA_ZOOM_MAX = 1.05  # Maximum zoom (zoomed in)
 CAMERA_ZOOM_SPEED_THRESHOLD = 500.0  # Speed at which zoom starts changing
+CAMERA_ZOOM_SPEED_THRESHOLD_SQ = CAMERA_ZOOM_SPEED_THRESHOLD * CAMERA_ZOOM_SPEED_THRESHOLD
 CAMERA_ANTICIPATION_DISTANCE = 150  # Pixels to look ahead based on velocity
 CAMERA_ANTICIPATION_SMOOTHING = 0.05  # How smoothly to apply anticipation
 CAMERA_SHAKE_FALL_MULTIPLIER = 0.02  # Shake intensity per pixel fallen
@@ -3,6 +3,7 @@ Mathematical utility functions for game calculations.
 """
 import math
 import random
+from src.utils.constants import SQUASH_REST_EPSILON
 
 
 def lerp(start, end, t):
@@ -155,6 +156,25 @@ def approach(current, target, amount):
     return target
 
 
+def squash_at_rest(*scales):
+    """
+    Check whether squash/stretch scale factors have settled at 1.0.
+    
+    Lerping back to 1.0 never lands on it exactly, so callers snap their
+    scales to 1.0 once this returns True.
+    
+    Args:
+        *scales: Current and target scale factors
+    
+    Returns:
+        True if every scale is within SQUASH_REST_EPSILON of 1.0
+    """
+    for scale in scales:
+        if abs(scale - 1.0) >= SQUASH_REST_EPSILON:
+            return False
+    return True
+
+
 def calculate_jump_distance(horizontal_speed, jump_velocity, gravity):
     """
     Calculate maximum horizontal distance for a jump arc.
@@ -28,6 +28,7 @@ class CollectibleSpawner:
     def __init__(self):
         """Initialize collectible spawner."""
         self.collectibles = []
+        self.collectible_pool = []  # Despawned collectibles kept for reuse
         self.spawn_distance = 1500  # Distance ahead to spawn
         self.last_spawn_x = 0
         self.min_spawn_interval = 200  # Minimum pixels between spawns
@@ -39,6 +40,7 @@ class CollectibleSpawner:
         # Performance limits
         self.max_active_collectibles = 40  # Hard limit on active collectibles
         self.max_visible_collectibles = 30  # Limit visible on screen at once
+        self.cull_padding = 100  # Off-screen margin before culling (smaller than platforms)
         
         # Power-up limiting: only 1 non-coin power-up visible at a time
         self.active_powerup_type = None  # Currently active non-coin type
@@ -46,6 +48,9 @@ class CollectibleSpawner:
         
         # Difficulty scaling
         self.difficulty_multiplier = 1.0
+        
+        # Build all collectible sprites now rather than on first spawn
+        Collectible.prewarm()
     
     def update(self, dt, camera_x, platforms, player_pos, magnet_active):
         """
@@ -58,22 +63,33 @@ class CollectibleSpawner:
             player_pos: Player position Vector2
             magnet_active: Whether magnet power-up is active
         """
-        # Update existing collectibles
-        for collectible in self.collectibles[:]:
-            collectible.update(dt, player_pos, magnet_active)
+        # Magnetic attraction runs as its own pass so the common no-magnet
+        # case costs nothing per collectible
+        if magnet_active and player_pos is not None:
+            for collectible in self.collectibles:
+                collectible.update_magnet(dt, player_pos)
+        
+        # Update existing collectibles, keeping only live ones in a single pass
+        # (avoids an O(N) list.remove() per discarded collectible)
+        despawn_x = camera_x - 200
+        visible_right = camera_x + SCREEN_WIDTH + self.cull_padding
+        remaining = []
+        for collectible in self.collectibles:
+            collectible.update(dt, visible_right)
             
-            # Remove collectibles that are too far behind camera
-            if collectible.position.x < camera_x - 200:
-                self.collectibles.remove(collectible)
-            elif not collectible.alive:
-                self.collectibles.remove(collectible)
+            # Drop collectibles that are too far behind camera or already collected
+            if collectible.alive and collectible.pos_x >= despawn_x:
+                remaining.append(collectible)
+            else:
+                self.collectible_pool.append(collectible)
+        self.collectibles = remaining
         
         # Update power-up tracking
         self._update_powerup_tracking()
         
-        # Check if we're at the collectible limit
-        active_count = sum(1 for c in self.collectibles if not c.collected)
-        if active_count >= self.max_active_collectibles:
+        # Check if we're at the collectible limit (collected ones were
+        # dropped above, so every remaining collectible is active)
+        if len(self.collectibles) >= self.max_active_collectibles:
             return  # Don't spawn more if at limit
         
         # Spawn new collectibles near platforms
@@ -81,13 +97,12 @@ class CollectibleSpawner:
         
         for platform in platforms:
             # Check if platform is in spawn range and we haven't spawned here yet
-            if (platform.position.x > self.last_spawn_x and
-                platform.position.x < spawn_x and
-                platform.position.x > camera_x):
+            if (platform.pos_x > self.last_spawn_x and
+                platform.pos_x < spawn_x and
+                platform.pos_x > camera_x):
                 
                 # Check limit again before spawning
-                active_count = sum(1 for c in self.collectibles if not c.collected)
-                if active_count >= self.max_active_collectibles:
+                if len(self.collectibles) >= self.max_active_collectibles:
                     break  # Stop spawning if at limit
                 
                 # Try to spawn collectible above this platform
@@ -98,17 +113,17 @@ class CollectibleSpawner:
                     if not self.has_active_powerup:
                         self._spawn_collectible_above_platform(platform, prefer_coin=False)
                 
-                self.last_spawn_x = platform.position.x
+                self.last_spawn_x = platform.pos_x
     
     def _update_powerup_tracking(self):
         """Update tracking of active non-coin power-ups."""
-        # Check if any non-coin power-ups exist
-        non_coin_collectibles = [c for c in self.collectibles
-                                 if not c.collected and c.type != CollectibleType.COIN]
+        # Find the first non-coin power-up without building a list every frame
+        powerup = next((c for c in self.collectibles
+                        if not c.collected and c.type != CollectibleType.COIN), None)
         
-        if non_coin_collectibles:
+        if powerup is not None:
             self.has_active_powerup = True
-            self.active_powerup_type = non_coin_collectibles[0].type
+            self.active_powerup_type = powerup.type
         else:
             self.has_active_powerup = False
             self.active_powerup_type = None
@@ -132,15 +147,15 @@ class CollectibleSpawner:
                 return
         
         # Position above platform center
-        x = platform.position.x + platform.width / 2
-        y = platform.position.y - 80  # Hover above platform
+        x = platform.pos_x + platform.width / 2
+        y = platform.pos_y - 80  # Hover above platform
         
         # Add some randomness to position
         x += random.uniform(-platform.width / 4, platform.width / 4)
         y += random.uniform(-20, 20)
         
         # Create collectible
-        collectible = Collectible(x, y, collectible_type)
+        collectible = self._get_collectible_from_pool(x, y, collectible_type)
         self.collectibles.append(collectible)
         
         # Update power-up tracking if this is a non-coin
@@ -183,9 +198,28 @@ class CollectibleSpawner:
             y: Y position
             collectible_type: CollectibleType enum value
         """
-        collectible = Collectible(x, y, collectible_type)
+        collectible = self._get_collectible_from_pool(x, y, collectible_type)
         self.collectibles.append(collectible)
     
+    def _get_collectible_from_pool(self, x, y, collectible_type):
+        """
+        Get a despawned collectible from the pool or create a new one.
+        
+        Args:
+            x: X position
+            y: Y position
+            collectible_type: CollectibleType enum value
+            
+        Returns:
+            Collectible instance
+        """
+        if self.collectible_pool:
+            collectible = self.collectible_pool.pop()
+            collectible.reset(x, y, collectible_type)
+            return collectible
+        
+        return Collectible(x, y, collectible_type)
+    
     def check_collision(self, player_rect):
         """
         Check if player collides with any collectibles.
@@ -198,8 +232,21 @@ class CollectibleSpawner:
         """
         collected = []
         
-        for collectible in self.collectibles[:]:
+        # Broad phase: a collectible whose center is farther than this from the
+        # player center can't overlap (largest box plus a pixel of rounding slack)
+        player_x = player_rect.centerx
+        player_y = player_rect.centery
+        reach_x = player_rect.width / 2 + Collectible.MAX_COLLISION_HALF + 2
+        reach_y = player_rect.height / 2 + Collectible.MAX_COLLISION_HALF + 2
+        reach_sq = reach_x * reach_x + reach_y * reach_y
+        
+        for collectible in self.collectibles:
             if not collectible.collected:
+                dx = collectible.pos_x - player_x
+                dy = collectible.pos_y + collectible.float_offset - player_y
+                if dx * dx + dy * dy > reach_sq:
+                    continue
+                
                 collectible_rect = collectible.get_collision_rect()
                 if player_rect.colliderect(collectible_rect):
                     collectible.collect()
@@ -218,6 +265,7 @@ class CollectibleSpawner:
     
     def clear(self):
         """Clear all collectibles."""
+        self.collectible_pool.extend(self.collectibles)
         self.collectibles.clear()
         self.last_spawn_x = 0
     
@@ -230,27 +278,31 @@ class CollectibleSpawner:
             camera: Camera instance
         """
         # Calculate visible area with padding
-        cull_padding = 100  # Smaller padding for collectibles
+        cull_padding = self.cull_padding
         visible_left = camera.position.x - cull_padding
         visible_right = camera.position.x + SCREEN_WIDTH + cull_padding
         visible_top = camera.position.y - cull_padding
         visible_bottom = camera.position.y + SCREEN_HEIGHT + cull_padding
         
-        # Only render collectibles within visible area, with a hard limit
-        rendered_count = 0
+        # Only render collectibles within visible area, with a hard limit.
+        # Sprites are gathered first and drawn with a single batched call.
+        blit_sequence = []
         for collectible in self.collectibles:
             if not collectible.collected:
                 # Stop rendering if we hit the visible limit
-                if rendered_count >= self.max_visible_collectibles:
+                if len(blit_sequence) >= self.max_visible_collectibles:
                     break
                 
                 # Cull collectibles outside visible area
-                if (collectible.position.x >= visible_left and
-                    collectible.position.x <= visible_right and
-                    collectible.position.y >= visible_top and
-                    collectible.position.y <= visible_bottom):
-                    collectible.render(screen, camera)
-                    rendered_count += 1
+                if (visible_left <= collectible.pos_x <= visible_right and
+                    visible_top <= collectible.pos_y <= visible_bottom):
+                    blit_args = collectible.get_blit_args(camera)
+                    if blit_args:
+                        blit_sequence.append(blit_args)
+        
+        if blit_sequence:
+            # fblits skips the per-blit rect bookkeeping that blits does
+            screen.fblits(blit_sequence)
     
     def get_active_count(self):
         """Get the number of active (uncollected) collectibles."""
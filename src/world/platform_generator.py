@@ -7,6 +7,22 @@ from src.utils.constants import *
 from src.utils.math_utils import calculate_jump_distance
 
 
+# Jump reach depends only on constants, so resolve it once at import
+# instead of on every generated platform
+SINGLE_JUMP_DISTANCE = calculate_jump_distance(
+    PLAYER_RUN_SPEED, JUMP_VELOCITY, GRAVITY
+)
+# Double jump adds extra distance from speed boost
+DOUBLE_JUMP_DISTANCE = calculate_jump_distance(
+    PLAYER_RUN_SPEED + DOUBLE_JUMP_SPEED_BOOST, DOUBLE_JUMP_VELOCITY, GRAVITY
+)
+# Helicopter adds glide distance
+HELICOPTER_DISTANCE = PLAYER_RUN_SPEED * HELICOPTER_DURATION
+MAX_REACHABLE_DISTANCE = SINGLE_JUMP_DISTANCE + HELICOPTER_DISTANCE
+# Using physics: max_height = v²/(2g) where v is jump velocity
+MAX_JUMP_HEIGHT = (JUMP_VELOCITY * JUMP_VELOCITY) / (2 * GRAVITY)
+
+
 class PlatformGenerator:
     """
     Generates platforms procedurally with difficulty scaling.
@@ -56,7 +72,7 @@ class PlatformGenerator:
         # Remove off-screen platforms (return to pool)
         new_platforms = []
         for p in self.platforms:
-            if p.position.x + p.width > camera_x - 200:
+            if p.pos_x + p.width > camera_x - 200:
                 new_platforms.append(p)
             else:
                 # Deactivate platform when removing it
@@ -77,22 +93,12 @@ class PlatformGenerator:
         min_gap = MIN_GAP
         max_gap = MAX_GAP_BASE + (self.difficulty * GAP_INCREASE_PER_DIFFICULTY)
         
-        # Calculate jump distances for different abilities
-        single_jump_distance = calculate_jump_distance(
-            PLAYER_RUN_SPEED, JUMP_VELOCITY, GRAVITY
-        )
-        
-        # Double jump adds extra distance from speed boost
-        double_jump_distance = calculate_jump_distance(
-            PLAYER_RUN_SPEED + DOUBLE_JUMP_SPEED_BOOST, DOUBLE_JUMP_VELOCITY, GRAVITY
-        )
-        
-        # Helicopter adds glide distance
-        helicopter_distance = PLAYER_RUN_SPEED * HELICOPTER_DURATION
-        max_reachable = single_jump_distance + helicopter_distance
+        # Jump distances for different abilities (precomputed at import)
+        single_jump_distance = SINGLE_JUMP_DISTANCE
+        double_jump_distance = DOUBLE_JUMP_DISTANCE
         
         # Ensure max gap doesn't exceed what's possible with helicopter
-        max_gap = min(max_gap, max_reachable * 0.85)
+        max_gap = min(max_gap, MAX_REACHABLE_DISTANCE * 0.85)
         
         # Create three distinct jump types with variety
         roll = random.random()
@@ -110,9 +116,8 @@ class PlatformGenerator:
             gap = random.uniform(double_jump_distance * 0.85, max_gap)
         
         # Height variation - create dramatic vertical gameplay
-        # Calculate max vertical reach with single jump + helicopter
-        # Using physics: max_height = v²/(2g) where v is jump velocity
-        max_jump_height = (JUMP_VELOCITY * JUMP_VELOCITY) / (2 * GRAVITY)
+        # Max vertical reach with single jump (precomputed at import)
+        max_jump_height = MAX_JUMP_HEIGHT
         
         # Create much more dramatic height variation
         # Positive height_diff = platform is lower (easier)
@@ -247,17 +252,9 @@ class PlatformGenerator:
         Returns:
             Maximum distance in pixels
         """
-        # Single jump distance
-        single_jump = calculate_jump_distance(
-            PLAYER_RUN_SPEED, JUMP_VELOCITY, GRAVITY
-        )
-        
-        # Helicopter adds extra distance
-        helicopter_distance = PLAYER_RUN_SPEED * HELICOPTER_DURATION
-        
         # Return single jump + helicopter as max
         # (Double jump is available but not required for platform spacing)
-        return single_jump + helicopter_distance
+        return MAX_REACHABLE_DISTANCE
     
     def get_platforms(self):
         """